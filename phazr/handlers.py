@@ -5,10 +5,13 @@ Operation handlers for different operation types.
 import asyncio
 import json
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Awaitable, Callable, Dict, Optional
 
 from .models import EnvironmentConfig, ExecutionResult, Operation, OperationType
 
+# Signature shared by asyncio.create_subprocess_shell/create_subprocess_exec
+SubprocessFactory = Callable[..., Awaitable[asyncio.subprocess.Process]]
+
 
 class OperationHandler(ABC):
     """Base class for operation handlers."""
@@ -21,7 +24,25 @@ class OperationHandler(ABC):
         pass
 
 
-class ScriptHandler(OperationHandler):
+class SubprocessHandler(OperationHandler):
+    """Base class for handlers that run local processes."""
+
+    def __init__(self, subprocess_factory: Optional[SubprocessFactory] = None):
+        # Falls back to asyncio's subprocess functions, looked up per call
+        self.subprocess_factory = subprocess_factory
+
+    async def _spawn_exec(self, *args: str, **kwargs) -> asyncio.subprocess.Process:
+        """Start a process from an argument list."""
+        create = self.subprocess_factory or asyncio.create_subprocess_exec
+        return await create(*args, **kwargs)
+
+    async def _spawn_shell(self, cmd: str, **kwargs) -> asyncio.subprocess.Process:
+        """Start a process through the shell."""
+        create = self.subprocess_factory or asyncio.create_subprocess_shell
+        return await create(cmd, **kwargs)
+
+
+class ScriptHandler(SubprocessHandler):
     """Handler for executing shell scripts."""
 
     async def execute(
@@ -33,7 +54,7 @@ class ScriptHandler(OperationHandler):
             env = self._prepare_environment(operation, environment)
 
             # Execute command
-            process = await asyncio.create_subprocess_shell(
+            process = await self._spawn_shell(
                 operation.command,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
@@ -84,7 +105,7 @@ class ScriptHandler(OperationHandler):
         return env
 
 
-class KubectlExecHandler(OperationHandler):
+class KubectlExecHandler(SubprocessHandler):
     """Handler for executing commands inside Kubernetes pods."""
 
     async def execute(
@@ -111,7 +132,7 @@ class KubectlExecHandler(OperationHandler):
             kubectl_cmd.extend(["--", "sh", "-c", operation.command])
 
             # Execute
-            process = await asyncio.create_subprocess_exec(
+            process = await self._spawn_exec(
                 *kubectl_cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
@@ -140,7 +161,7 @@ class KubectlExecHandler(OperationHandler):
             return ExecutionResult(operation=operation, success=False, error=str(e))
 
 
-class KubectlRestartHandler(OperationHandler):
+class KubectlRestartHandler(SubprocessHandler):
     """Handler for restarting Kubernetes deployments."""
 
     async def execute(
@@ -164,7 +185,7 @@ class KubectlRestartHandler(OperationHandler):
             )
 
             # Execute restart
-            process = await asyncio.create_subprocess_exec(
+            process = await self._spawn_exec(
                 *kubectl_cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
@@ -212,7 +233,7 @@ class KubectlRestartHandler(OperationHandler):
             ]
         )
 
-        process = await asyncio.create_subprocess_exec(
+        process = await self._spawn_exec(
             *kubectl_cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
         )
 
@@ -224,7 +245,7 @@ class KubectlRestartHandler(OperationHandler):
             )
 
 
-class KubectlApplyHandler(OperationHandler):
+class KubectlApplyHandler(SubprocessHandler):
     """Handler for applying Kubernetes manifests."""
 
     async def execute(
@@ -253,7 +274,7 @@ class KubectlApplyHandler(OperationHandler):
 
             # Execute
             if stdin_data:
-                process = await asyncio.create_subprocess_exec(
+                process = await self._spawn_exec(
                     *kubectl_cmd,
                     stdin=asyncio.subprocess.PIPE,
                     stdout=asyncio.subprocess.PIPE,
@@ -261,7 +282,7 @@ class KubectlApplyHandler(OperationHandler):
                 )
                 stdout, stderr = await process.communicate(input=stdin_data)
             else:
-                process = await asyncio.create_subprocess_exec(
+                process = await self._spawn_exec(
                     *kubectl_cmd,
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.PIPE,
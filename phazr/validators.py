@@ -3,11 +3,62 @@ Prerequisite validators for the orchestration framework.
 """
 
 import asyncio
+import os
+import re
+import shlex
+import shutil
+import stat
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from .handlers import SubprocessFactory
 from .models import EnvironmentConfig
 
+_DEFAULT_MAX_PROCESSES = 16
+
+
+def _max_processes_from_env() -> int:
+    """Read PHAZR_MAX_PROCS, falling back to the default when it is not a number."""
+    try:
+        value = int(os.environ.get("PHAZR_MAX_PROCS", _DEFAULT_MAX_PROCESSES))
+    except ValueError:
+        return _DEFAULT_MAX_PROCESSES
+    # A cap of zero or less would leave every validator waiting forever
+    return max(value, 1)
+
+
+# Cap on validator subprocesses running at once, so concurrent validation does
+# not fork-storm small hosts
+MAX_PROCESSES = _max_processes_from_env()
+
+# asyncio semaphores bind to a loop, so the semaphore is remade for each new loop
+_process_semaphore: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+
+
+def _process_slots() -> asyncio.Semaphore:
+    """Return the subprocess semaphore for the running event loop."""
+    global _process_semaphore
+
+    loop = asyncio.get_running_loop()
+    if _process_semaphore is None or _process_semaphore[0] is not loop:
+        _process_semaphore = (loop, asyncio.Semaphore(MAX_PROCESSES))
+    return _process_semaphore[1]
+
+
+async def _run_with_timeout(
+    process: asyncio.subprocess.Process, timeout: float
+) -> Tuple[bytes, bytes]:
+    """Collect a process's output, killing and reaping it on timeout."""
+    try:
+        return await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+        raise
+
 
 class Validator(ABC):
     """Base class for validators."""
@@ -18,38 +69,112 @@ class Validator(ABC):
         pass
 
 
+# Characters that only mean something to a shell: pipes, redirects, variables,
+# globs and command separators. Version commands containing any of them are run
+# through the shell instead of being split into an argument list.
+_SHELL_METACHARACTERS = frozenset("|&;<>()$`*?[]{}~\n")
+
+# A leading NAME=value word sets an environment variable, which only a shell does
+_ENV_ASSIGNMENT = re.compile(r"[A-Za-z_][A-Za-z0-9_]*=")
+
+
+def _split_version_command(command: str) -> Optional[List[str]]:
+    """Split a version command into argv, or return None if it needs a shell.
+
+    Commands with shell syntax, a leading environment assignment, or quoting
+    shlex cannot parse are left for the shell to interpret.
+    """
+    if not _SHELL_METACHARACTERS.isdisjoint(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if not argv or _ENV_ASSIGNMENT.match(argv[0]):
+        return None
+    return argv
+
+
+# Successful version probes keyed by (tool_name, version_command), shared by all
+# ToolValidator instances so an installed tool is only probed once per process.
+# Failures are not cached, so a tool installed later is picked up on the next run.
+_VERSION_CACHE: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+# One lock per cache key, so concurrent validations of the same tool share a
+# single probe. Remade for each new loop, like the subprocess semaphore.
+_probe_locks: Optional[
+    Tuple[asyncio.AbstractEventLoop, Dict[Tuple[str, str], asyncio.Lock]]
+] = None
+
+
+def _probe_lock(key: Tuple[str, str]) -> asyncio.Lock:
+    """Return the lock guarding one version probe on the running event loop."""
+    global _probe_locks
+
+    loop = asyncio.get_running_loop()
+    if _probe_locks is None or _probe_locks[0] is not loop:
+        _probe_locks = (loop, {})
+    lock = _probe_locks[1].get(key)
+    if lock is None:
+        lock = _probe_locks[1][key] = asyncio.Lock()
+    return lock
+
+
 class ToolValidator(Validator):
     """Validate that required tools are installed."""
 
-    def __init__(self, tool_name: str, version_command: Optional[str] = None):
+    def __init__(
+        self,
+        tool_name: str,
+        version_command: Optional[str] = None,
+        *,
+        subprocess_factory: Optional[SubprocessFactory] = None,
+    ):
         self.tool_name = tool_name
         self.version_command = version_command or f"{tool_name} --version"
+        argv = _split_version_command(self.version_command)
+        self._use_shell = argv is None
+        self._argv = argv or []
+        # Falls back to asyncio's subprocess functions, looked up per call
+        self.subprocess_factory = subprocess_factory
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all cached version probes."""
+        _VERSION_CACHE.clear()
 
     async def validate(self) -> Dict[str, Any]:
         """Check if tool is available."""
-        try:
-            process = await asyncio.create_subprocess_shell(
-                self.version_command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+        key = (self.tool_name, self.version_command)
+        cached = _VERSION_CACHE.get(key)
+        if cached is not None:
+            return dict(cached)
+
+        async with _probe_lock(key):
+            # Another validation may have finished the probe while this one waited
+            cached = _VERSION_CACHE.get(key)
+            if cached is not None:
+                return dict(cached)
+            return await self._probe(key)
+
+    async def _probe(self, key: Tuple[str, str]) -> Dict[str, Any]:
+        """Run the version command and cache a successful result."""
+        # A PATH lookup settles a missing tool without spawning a process
+        if not self._use_shell and shutil.which(self._argv[0]) is None:
+            return {
+                "status": "failed",
+                "tool": self.tool_name,
+                "message": f"{self.tool_name} not found: {self._argv[0]} not on PATH",
+            }
 
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=5.0)
+        try:
+            async with _process_slots():
+                process = await self._spawn(
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
 
-            if process.returncode == 0:
-                version = stdout.decode().strip() or stderr.decode().strip()
-                return {
-                    "status": "passed",
-                    "tool": self.tool_name,
-                    "version": version,
-                    "message": f"{self.tool_name} is available",
-                }
-            else:
-                return {
-                    "status": "failed",
-                    "tool": self.tool_name,
-                    "message": f"{self.tool_name} command failed",
-                }
+                stdout, stderr = await _run_with_timeout(process, 5.0)
 
         except asyncio.TimeoutError:
             return {
@@ -64,143 +189,165 @@ class ToolValidator(Validator):
                 "message": f"{self.tool_name} not found: {e}",
             }
 
+        if process.returncode != 0:
+            return {
+                "status": "failed",
+                "tool": self.tool_name,
+                "message": f"{self.tool_name} command failed",
+            }
+
+        version = stdout.decode().strip() or stderr.decode().strip()
+        result = {
+            "status": "passed",
+            "tool": self.tool_name,
+            "version": version,
+            "message": f"{self.tool_name} is available",
+        }
+        _VERSION_CACHE[key] = result
+        return dict(result)
+
+    async def _spawn(self, **kwargs) -> asyncio.subprocess.Process:
+        """Start the version command, through the shell only if it needs one."""
+        if self._use_shell:
+            create = self.subprocess_factory or asyncio.create_subprocess_shell
+            return await create(self.version_command, **kwargs)
+
+        create = self.subprocess_factory or asyncio.create_subprocess_exec
+        return await create(*self._argv, **kwargs)
+
 
 class KubernetesValidator(Validator):
     """Validate Kubernetes connectivity and permissions."""
 
-    def __init__(self, namespace: str, context: Optional[str] = None):
+    def __init__(
+        self,
+        namespace: str,
+        context: Optional[str] = None,
+        *,
+        subprocess_factory: Optional[SubprocessFactory] = None,
+    ):
         self.namespace = namespace
         self.context = context
+        # Falls back to asyncio.create_subprocess_exec, looked up per call
+        self.subprocess_factory = subprocess_factory
+
+        # kubectl argv for each check, built once per validator
+        kubectl = ("kubectl", "--context", context) if context else ("kubectl",)
+        self._namespace_argv = (
+            *kubectl,
+            "get",
+            "--raw",
+            f"/api/v1/namespaces/{namespace}",
+        )
+        self._auth_argv = (*kubectl, "auth", "can-i", "list", "pods", "-n", namespace)
 
     async def validate(self) -> Dict[str, Any]:
         """Check Kubernetes access."""
-        results: Dict[str, Any] = {"status": "passed", "checks": []}
+        # Checks are independent kubectl round-trips, so run them together
+        (cluster, namespace), permissions = await asyncio.gather(
+            self._check_cluster_and_namespace(),
+            self._check_permissions(),
+        )
 
-        # Check cluster connectivity
-        kubectl_cmd = ["kubectl"]
-        if self.context:
-            kubectl_cmd.extend(["--context", self.context])
+        if namespace is None:
+            return {"status": "failed", "checks": [cluster]}
 
-        # Test cluster info
-        try:
-            process = await asyncio.create_subprocess_exec(
-                *kubectl_cmd,
-                "cluster-info",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+        results: Dict[str, Any] = {"status": "passed", "checks": [cluster, namespace]}
+        if permissions is not None:
+            results["checks"].append(permissions)
 
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=10.0)
+        if not all(check["passed"] for check in results["checks"]):
+            results["status"] = "warning"
 
-            if process.returncode == 0:
-                results["checks"].append(
-                    {
-                        "name": "cluster_connectivity",
-                        "passed": True,
-                        "message": "Connected to cluster",
-                    }
-                )
-            else:
-                results["status"] = "failed"
-                results["checks"].append(
-                    {
-                        "name": "cluster_connectivity",
-                        "passed": False,
-                        "message": f"Cannot connect to cluster: {stderr.decode()}",
-                    }
-                )
-                return results
+        return results
 
-        except Exception as e:
-            results["status"] = "failed"
-            results["checks"].append(
-                {
-                    "name": "cluster_connectivity",
-                    "passed": False,
-                    "message": f"Cannot connect to cluster: {e}",
-                }
-            )
-            return results
+    async def _check_cluster_and_namespace(
+        self,
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Check cluster connectivity and namespace access with one request.
 
-        # Check namespace access
+        Fetching the namespace from the API server proves the cluster is
+        reachable. An "Error from server" reply means the cluster answered but
+        the namespace is missing or forbidden. The namespace check is None when
+        the cluster could not be reached.
+        """
         try:
-            process = await asyncio.create_subprocess_exec(
-                *kubectl_cmd,
-                "get",
-                "namespace",
-                self.namespace,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            create_subprocess = (
+                self.subprocess_factory or asyncio.create_subprocess_exec
             )
-
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=10.0)
-
-            if process.returncode == 0:
-                results["checks"].append(
-                    {
-                        "name": "namespace_access",
-                        "passed": True,
-                        "message": f"Namespace {self.namespace} is accessible",
-                    }
-                )
-            else:
-                results["status"] = "warning"
-                results["checks"].append(
-                    {
-                        "name": "namespace_access",
-                        "passed": False,
-                        "message": f"Cannot access namespace {self.namespace}",
-                    }
+            async with _process_slots():
+                process = await create_subprocess(
+                    *self._namespace_argv,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
                 )
 
+                stdout, stderr = await _run_with_timeout(process, 10.0)
+
         except Exception as e:
-            results["status"] = "warning"
-            results["checks"].append(
-                {
-                    "name": "namespace_access",
-                    "passed": False,
-                    "message": f"Error checking namespace: {e}",
-                }
-            )
+            return {
+                "name": "cluster_connectivity",
+                "passed": False,
+                "message": f"Cannot connect to cluster: {e}",
+            }, None
+
+        error = stderr.decode()
+        if process.returncode != 0 and "Error from server" not in error:
+            return {
+                "name": "cluster_connectivity",
+                "passed": False,
+                "message": f"Cannot connect to cluster: {error}",
+            }, None
+
+        cluster = {
+            "name": "cluster_connectivity",
+            "passed": True,
+            "message": "Connected to cluster",
+        }
+
+        if process.returncode == 0:
+            return cluster, {
+                "name": "namespace_access",
+                "passed": True,
+                "message": f"Namespace {self.namespace} is accessible",
+            }
+        else:
+            return cluster, {
+                "name": "namespace_access",
+                "passed": False,
+                "message": f"Cannot access namespace {self.namespace}",
+            }
 
-        # Check pod list permissions
+    async def _check_permissions(self) -> Optional[Dict[str, Any]]:
+        """Check pod list permissions; None if the check could not run."""
         try:
-            process = await asyncio.create_subprocess_exec(
-                *kubectl_cmd,
-                "auth",
-                "can-i",
-                "list",
-                "pods",
-                "-n",
-                self.namespace,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            create_subprocess = (
+                self.subprocess_factory or asyncio.create_subprocess_exec
             )
+            async with _process_slots():
+                process = await create_subprocess(
+                    *self._auth_argv,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
 
-            await process.communicate()
+                await _run_with_timeout(process, 10.0)
 
             if process.returncode == 0:
-                results["checks"].append(
-                    {
-                        "name": "pod_permissions",
-                        "passed": True,
-                        "message": "Can list pods",
-                    }
-                )
+                return {
+                    "name": "pod_permissions",
+                    "passed": True,
+                    "message": "Can list pods",
+                }
             else:
-                results["status"] = "warning"
-                results["checks"].append(
-                    {
-                        "name": "pod_permissions",
-                        "passed": False,
-                        "message": "Cannot list pods",
-                    }
-                )
+                return {
+                    "name": "pod_permissions",
+                    "passed": False,
+                    "message": "Cannot list pods",
+                }
 
         except Exception:
-            pass  # Non-critical check
-
-        return results
+            return None  # Non-critical check
 
 
 class FileSystemValidator(Validator):
@@ -211,32 +358,40 @@ class FileSystemValidator(Validator):
 
     async def validate(self) -> Dict[str, Any]:
         """Check file system requirements."""
-        from pathlib import Path
+        # Stat the paths concurrently in the default executor, off the event loop
+        loop = asyncio.get_running_loop()
+        paths = await asyncio.gather(
+            *(
+                loop.run_in_executor(None, self._check_path, path_str)
+                for path_str in self.required_paths
+            )
+        )
 
-        results: Dict[str, Any] = {"status": "passed", "paths": []}
+        results: Dict[str, Any] = {"status": "passed", "paths": list(paths)}
+        if not all(path_info["exists"] for path_info in paths):
+            results["status"] = "warning"
 
-        for path_str in self.required_paths:
-            path = Path(path_str)
+        return results
 
-            if path.exists():
-                results["paths"].append(
-                    {
-                        "path": path_str,
-                        "exists": True,
-                        "type": "directory" if path.is_dir() else "file",
-                    }
-                )
-            else:
-                results["status"] = "warning"
-                results["paths"].append(
-                    {
-                        "path": path_str,
-                        "exists": False,
-                        "message": f"Path {path_str} does not exist",
-                    }
-                )
+    @staticmethod
+    def _check_path(path_str: str) -> Dict[str, Any]:
+        """Describe a single required path using one stat call."""
+        try:
+            mode = os.stat(path_str).st_mode
+        except (OSError, ValueError):
+            # Covers missing paths as well as symlink loops, unreadable parents
+            # and embedded NUL bytes, all of which Path.exists() reports as False
+            return {
+                "path": path_str,
+                "exists": False,
+                "message": f"Path {path_str} does not exist",
+            }
 
-        return results
+        return {
+            "path": path_str,
+            "exists": True,
+            "type": "directory" if stat.S_ISDIR(mode) else "file",
+        }
 
 
 class NetworkValidator(Validator):
@@ -247,60 +402,65 @@ class NetworkValidator(Validator):
 
     async def validate(self) -> Dict[str, Any]:
         """Check network endpoints."""
-        results: Dict[str, Any] = {"status": "passed", "endpoints": []}
+        import aiohttp
 
-        for endpoint in self.endpoints:
-            try:
-                # Simple ping-like check using curl
-                process = await asyncio.create_subprocess_exec(
-                    "curl",
-                    "-I",
-                    "-s",
-                    "-o",
-                    "/dev/null",
-                    "-w",
-                    "%{http_code}",
-                    endpoint,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
+        results: Dict[str, Any] = {"status": "passed", "endpoints": []}
+        if not self.endpoints:
+            return results
 
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(), timeout=5.0
+        # One pooled session for all endpoints, checked concurrently
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32)
+        ) as session:
+            endpoints = await asyncio.gather(
+                *(
+                    self._check_endpoint(session, endpoint)
+                    for endpoint in self.endpoints
                 )
+            )
 
-                if process.returncode == 0:
-                    results["endpoints"].append(
-                        {
-                            "endpoint": endpoint,
-                            "reachable": True,
-                            "status_code": stdout.decode().strip(),
-                        }
-                    )
-                else:
-                    results["status"] = "warning"
-                    results["endpoints"].append(
-                        {
-                            "endpoint": endpoint,
-                            "reachable": False,
-                            "message": "Endpoint not reachable",
-                        }
-                    )
-
-            except Exception as e:
-                results["status"] = "warning"
-                results["endpoints"].append(
-                    {"endpoint": endpoint, "reachable": False, "message": str(e)}
-                )
+        results["endpoints"] = list(endpoints)
+        if not all(endpoint_info["reachable"] for endpoint_info in endpoints):
+            results["status"] = "warning"
 
         return results
 
+    async def _check_endpoint(self, session: Any, endpoint: str) -> Dict[str, Any]:
+        """Send a HEAD request to a single endpoint."""
+        import aiohttp
+
+        try:
+            async with session.head(
+                endpoint, timeout=aiohttp.ClientTimeout(total=5.0)
+            ) as response:
+                return {
+                    "endpoint": endpoint,
+                    "reachable": True,
+                    "status_code": str(response.status),
+                }
+
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return {
+                "endpoint": endpoint,
+                "reachable": False,
+                "message": "Endpoint not reachable",
+            }
+        except Exception as e:
+            return {"endpoint": endpoint, "reachable": False, "message": str(e)}
+
 
 class PrerequisiteValidator:
     """Main validator for checking all prerequisites."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        tool_validator_factory: Callable[[str], Validator] = ToolValidator,
+        kubernetes_validator_factory: Callable[..., Validator] = KubernetesValidator,
+    ):
         self.validators: List[Validator] = []
+        # Build the default validators; tests substitute their own
+        self.tool_validator_factory = tool_validator_factory
+        self.kubernetes_validator_factory = kubernetes_validator_factory
 
     def add_validator(self, validator: Validator):
         """Add a validator to the chain."""
@@ -310,6 +470,13 @@ class PrerequisiteValidator:
         self, environment: EnvironmentConfig, required_tools: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """Run all validators and aggregate results."""
+        if not required_tools and not self.validators:
+            return {
+                "all_passed": True,
+                "has_warnings": False,
+                "results": [],
+                "summary": self._generate_summary([]),
+            }
 
         # Add default validators
         validators: List[Validator] = []
@@ -317,12 +484,12 @@ class PrerequisiteValidator:
         # Tool validators
         if required_tools:
             for tool in required_tools:
-                validators.append(ToolValidator(tool))
+                validators.append(self.tool_validator_factory(tool))
 
         # Only add Kubernetes validator if kubectl is in required tools
         if required_tools and "kubectl" in required_tools:
             validators.append(
-                KubernetesValidator(
+                self.kubernetes_validator_factory(
                     namespace=environment.namespace, context=environment.context
                 )
             )
@@ -330,15 +497,28 @@ class PrerequisiteValidator:
         # Add any custom validators
         validators.extend(self.validators)
 
-        # Run all validators
-        all_results = []
+        # Run all validators concurrently; a crashed validator counts as failed
+        # and is named in its result so the failure can be traced
+        outcomes = await asyncio.gather(
+            *(validator.validate() for validator in validators), return_exceptions=True
+        )
+        all_results: List[Dict[str, Any]] = [
+            (
+                {
+                    "status": "failed",
+                    "validator": type(validator).__name__,
+                    "message": f"{type(validator).__name__} raised "
+                    f"{type(outcome).__name__}: {outcome}",
+                }
+                if isinstance(outcome, BaseException)
+                else outcome
+            )
+            for validator, outcome in zip(validators, outcomes)
+        ]
         all_passed = True
         has_warnings = False
 
-        for validator in validators:
-            result = await validator.validate()
-            all_results.append(result)
-
+        for result in all_results:
             if result.get("status") == "failed":
                 all_passed = False
             elif result.get("status") == "warning":
@@ -2,7 +2,6 @@
 Shared pytest fixtures and test configuration.
 """
 
-import asyncio
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock
@@ -10,6 +9,11 @@ from unittest.mock import AsyncMock, Mock
 import pytest
 import yaml
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from phazr.config import ConfigManager
 from phazr.display import DisplayManager
 from phazr.executor import Orchestrator
@@ -314,13 +318,11 @@ def mock_subprocess():
     return mock
 
 
-@pytest.fixture
-def event_loop():
-    """Create an event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    yield loop
-    loop.close()
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
 
 
 # Test utilities
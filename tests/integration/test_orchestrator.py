@@ -137,7 +137,6 @@ class TestOrchestrator:
             display=mock_display,
         )
 
-    @pytest.mark.asyncio
     async def test_orchestrator_initialization(
         self, sample_orchestrator_config_with_phases
     ):
@@ -149,7 +148,6 @@ class TestOrchestrator:
         assert orchestrator.display is not None
         assert orchestrator.logger is not None
 
-    @pytest.mark.asyncio
     async def test_execute_single_phase_success(self, orchestrator, mock_display):
         """Test executing a single phase successfully."""
         # This test assumes the orchestrator has methods for phase execution
@@ -170,7 +168,6 @@ class TestOrchestrator:
             # This is a placeholder for the integration test structure
             pass
 
-    @pytest.mark.asyncio
     async def test_phase_dependency_resolution(self, orchestrator):
         """Test that phases execute in correct dependency order."""
         # Track execution order
@@ -185,7 +182,6 @@ class TestOrchestrator:
             # Implementation depends on orchestrator's actual interface
             pass
 
-    @pytest.mark.asyncio
     async def test_parallel_group_execution(self, orchestrator):
         """Test parallel execution of operation groups."""
         # Create phase with parallel groups enabled
@@ -201,7 +197,6 @@ class TestOrchestrator:
         assert parallel_phase.parallel_groups is True
         pass
 
-    @pytest.mark.asyncio
     async def test_error_handling_continue_on_error(self, mock_handler_registry):
         """Test error handling with continue_on_error enabled."""
         # Register a failing handler for one operation type
@@ -260,7 +255,6 @@ class TestOrchestrator:
         assert orchestrator.config.execution.continue_on_error is True
         pass
 
-    @pytest.mark.asyncio
     async def test_dry_run_mode(
         self, sample_orchestrator_config_with_phases, mock_handler_registry
     ):
@@ -278,7 +272,6 @@ class TestOrchestrator:
         assert orchestrator.config.execution.dry_run is True
         pass
 
-    @pytest.mark.asyncio
     async def test_operation_timeout_handling(self, mock_handler_registry):
         """Test handling of operation timeouts."""
         # Create a slow handler that exceeds timeout
@@ -313,7 +306,6 @@ class TestOrchestrator:
         assert orchestrator.config.versions["1.0.0"] is not None
         pass
 
-    @pytest.mark.asyncio
     async def test_operation_retry_logic(self, mock_handler_registry):
         """Test operation retry logic."""
 
@@ -360,7 +352,6 @@ class TestOrchestrator:
         assert orchestrator.handler_registry is not None
         pass
 
-    @pytest.mark.asyncio
     async def test_disabled_phase_skipping(
         self, sample_orchestrator_config_with_phases, mock_handler_registry
     ):
@@ -380,7 +371,6 @@ class TestOrchestrator:
         assert orchestrator.config.phases[1].enabled is False
         pass
 
-    @pytest.mark.asyncio
     async def test_missing_handler_error(self, sample_orchestrator_config_with_phases):
         """Test error handling when operation handler is missing."""
         # Create empty handler registry
@@ -400,7 +390,6 @@ class TestOrchestrator:
         )
         pass
 
-    @pytest.mark.asyncio
     async def test_complex_dependency_graph(self, mock_handler_registry):
         """Test complex phase dependency resolution."""
         # Create diamond dependency pattern:
@@ -462,7 +451,6 @@ class TestOrchestrator:
         assert len(orchestrator.config.phases) == 4
         pass
 
-    @pytest.mark.asyncio
     async def test_version_selection(self, mock_handler_registry):
         """Test running operations for specific version."""
         # Create config with multiple versions
@@ -508,7 +496,6 @@ class TestOrchestrator:
 class TestOrchestratorErrorScenarios:
     """Test orchestrator error scenarios and edge cases."""
 
-    @pytest.mark.asyncio
     async def test_circular_dependency_detection(self):
         """Test detection of circular phase dependencies."""
         # Create phases with circular dependency
@@ -547,7 +534,6 @@ class TestOrchestratorErrorScenarios:
         assert len(config.phases) == 3
         pass
 
-    @pytest.mark.asyncio
     async def test_missing_dependency_handling(self):
         """Test handling of missing phase dependencies."""
         phases = [
@@ -575,7 +561,6 @@ class TestOrchestratorErrorScenarios:
         assert config.phases[0].depends_on == ["nonexistent_phase"]
         pass
 
-    @pytest.mark.asyncio
     async def test_empty_phase_handling(self):
         """Test handling of phases with no operations."""
         phases = [Phase(name="empty_phase", groups=["nonexistent_group"], enabled=True)]
@@ -0,0 +1,60 @@
+"""
+Shared fixtures for unit tests.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from phazr.models import EnvironmentConfig
+
+
+@pytest.fixture(scope="module")
+def environment():
+    """Environment shared across a module's tests; consumers only read it."""
+    return EnvironmentConfig(name="test", namespace="test-ns")
+
+
+@pytest.fixture(scope="module")
+def make_proc():
+    """Factory for mock subprocesses with a canned exit code and output."""
+
+    def _make(returncode=0, stdout=b"", stderr=b""):
+        # Only the coroutine methods are async; kill() stays a plain Mock
+        return Mock(
+            returncode=returncode,
+            communicate=AsyncMock(return_value=(stdout, stderr)),
+            wait=AsyncMock(return_value=returncode),
+        )
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def fake_kubectl(make_proc):
+    """Factory for kubectl subprocess factories.
+
+    The Kubernetes checks run concurrently, so outcomes are keyed by a kubectl
+    argument such as "--raw" or "can-i" rather than by call order. Each outcome
+    is a (returncode, stdout, stderr) tuple, or an exception to raise instead.
+    """
+
+    def _fake(outcomes):
+        # One process per distinct outcome, shared by every argument mapping to it
+        procs = {
+            outcome: make_proc(*outcome)
+            for outcome in outcomes.values()
+            if not isinstance(outcome, Exception)
+        }
+
+        def side_effect(*args, **kwargs):
+            for argument, outcome in outcomes.items():
+                if argument in args:
+                    if isinstance(outcome, Exception):
+                        raise outcome
+                    return procs[outcome]
+            raise AssertionError(f"Unexpected command: {args}")
+
+        return AsyncMock(side_effect=side_effect)
+
+    return _fake
@@ -3,7 +3,10 @@ Unit tests for phazr.handlers module.
 """
 
 import asyncio
-from unittest.mock import AsyncMock, Mock, patch
+import inspect
+import json
+import os
+from unittest.mock import AsyncMock, call, patch
 
 import pytest
 from aioresponses import aioresponses
@@ -20,6 +23,166 @@ from phazr.handlers import (
 from phazr.models import EnvironmentConfig, ExecutionResult, Operation, OperationType
 from tests.utils.test_helpers import MockProcess
 
+# Canned processes shared by tests that only read their output.
+_MP_HELLO = MockProcess(returncode=0, stdout=b"Hello World\n", stderr=b"")
+_MP_FAIL = MockProcess(returncode=1, stdout=b"", stderr=b"Command failed\n")
+_MP_LISTING = MockProcess(
+    returncode=0,
+    stdout=b"total 4\ndrwxr-xr-x 2 root root 4096 Jan  1 12:00 .\n",
+    stderr=b"",
+)
+_MP_PS = MockProcess(returncode=0, stdout=b"PID USER\n")
+_MP_RESTARTED = MockProcess(returncode=0, stdout=b"deployment.apps/web-app restarted\n")
+_MP_API_RESTARTED = MockProcess(returncode=0, stdout=b"deployment.apps/api restarted\n")
+_MP_NOT_FOUND = MockProcess(returncode=1, stderr=b"deployment 'web-app' not found")
+_MP_OK = MockProcess(returncode=0)
+_MP_ERROR = MockProcess(returncode=1)
+_MP_CREATED = MockProcess(returncode=0, stdout=b"deployment.apps/web-app created\n")
+_MP_CONFIGMAP_CREATED = MockProcess(returncode=0, stdout=b"configmap/test created\n")
+_MP_APPLIED = MockProcess(returncode=0, stdout=b"applied\n")
+# Shared across tests and reset after every test by _reset_shared_mocks.
+_MP_TIMEOUT = MockProcess()
+_MP_TIMEOUT.wait = AsyncMock()
+
+# Request payloads for the HTTP handler tests, serialized once.
+_GET_CMD = json.dumps({"url": "http://api.example.com/health", "method": "GET"})
+_POST_CMD = json.dumps(
+    {
+        "url": "http://api.example.com/deploy",
+        "method": "POST",
+        "data": {"version": "1.0.0"},
+    }
+)
+_ERROR_CMD = json.dumps({"url": "http://api.example.com/error", "method": "GET"})
+_UNREACHABLE_CMD = json.dumps({"url": "http://api.example.com/down", "method": "GET"})
+
+# Expected subprocess invocations for the kubectl handler tests.
+_EXPECTED_EXEC_CALL = call(
+    "kubectl",
+    "--context",
+    "prod-cluster",
+    "exec",
+    "-n",
+    "prod",
+    "web-app",
+    "-c",
+    "app",
+    "--",
+    "sh",
+    "-c",
+    "ls -la",
+    stdout=asyncio.subprocess.PIPE,
+    stderr=asyncio.subprocess.PIPE,
+)
+_EXPECTED_EXEC_NO_CONTAINER_CALL = call(
+    "kubectl",
+    "--context",
+    "prod-cluster",
+    "exec",
+    "-n",
+    "prod",
+    "web-app",
+    "--",
+    "sh",
+    "-c",
+    "ps aux",
+    stdout=asyncio.subprocess.PIPE,
+    stderr=asyncio.subprocess.PIPE,
+)
+_EXPECTED_RESTART_CALL = call(
+    "kubectl",
+    "--context",
+    "staging-cluster",
+    "rollout",
+    "restart",
+    "deployment",
+    "web-app",
+    "-n",
+    "staging",
+    stdout=asyncio.subprocess.PIPE,
+    stderr=asyncio.subprocess.PIPE,
+)
+_EXPECTED_APPLY_CALL = call(
+    "kubectl",
+    "apply",
+    "-n",
+    "test-ns",
+    "-f",
+    "manifests/deployment.yaml",
+    stdout=asyncio.subprocess.PIPE,
+    stderr=asyncio.subprocess.PIPE,
+)
+_EXPECTED_APPLY_CONTEXT_CALL = call(
+    "kubectl",
+    "--context",
+    "prod-cluster",
+    "apply",
+    "-n",
+    "production",
+    "-f",
+    "manifests/deployment.yaml",
+    stdout=asyncio.subprocess.PIPE,
+    stderr=asyncio.subprocess.PIPE,
+)
+
+
+def _wait_for_mock(outcome):
+    """Build an asyncio.wait_for AsyncMock that returns or raises ``outcome``.
+
+    A coroutine handed to the mock is closed so it is not reported as never
+    awaited.
+    """
+
+    def _side_effect(aw, timeout=None):
+        if inspect.iscoroutine(aw):
+            aw.close()
+        if isinstance(outcome, tuple):
+            return outcome
+        raise outcome
+
+    return AsyncMock(side_effect=_side_effect)
+
+
+# One wait_for mock per outcome, shared by the tests that need it.
+_WAIT_FOR_HELLO = _wait_for_mock((b"Hello World\n", b""))
+_WAIT_FOR_FAILED = _wait_for_mock((b"", b"Command failed\n"))
+_WAIT_FOR_LISTING = _wait_for_mock((_MP_LISTING.stdout.data, b""))
+_WAIT_FOR_PS = _wait_for_mock((b"PID USER\n", b""))
+_WAIT_FOR_TIMEOUT = _wait_for_mock(asyncio.TimeoutError)
+
+
+class _StubHandler(OperationHandler):
+    """Minimal concrete handler for registry tests."""
+
+    async def execute(self, operation, environment):
+        return None
+
+
+_SHARED_WAIT_FOR_MOCKS = (
+    _WAIT_FOR_HELLO,
+    _WAIT_FOR_FAILED,
+    _WAIT_FOR_LISTING,
+    _WAIT_FOR_PS,
+    _WAIT_FOR_TIMEOUT,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_mocks():
+    """Forget calls recorded on the module's shared mocks after each test."""
+    yield
+    _MP_TIMEOUT.kill.reset_mock()
+    _MP_TIMEOUT.wait.reset_mock()
+    for wait_for_mock in _SHARED_WAIT_FOR_MOCKS:
+        wait_for_mock.reset_mock()
+
+
+@pytest.fixture
+def wait_for_behavior(request, monkeypatch):
+    """Install the parametrized asyncio.wait_for mock."""
+    monkeypatch.setattr(asyncio, "wait_for", request.param)
+    return request.param
+
 
 class TestOperationHandler:
     """Test abstract OperationHandler class."""
@@ -43,13 +206,14 @@ class TestOperationHandler:
 class TestScriptHandler:
     """Test ScriptHandler class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def handler(self):
         """Create ScriptHandler instance."""
         return ScriptHandler()
 
-    @pytest.fixture
-    def sample_operation(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_operation(cls):
         """Sample script operation."""
         return Operation(
             command="echo 'Hello World'",
@@ -58,29 +222,57 @@ class TestScriptHandler:
             timeout=30,
         )
 
-    @pytest.fixture
-    def sample_environment(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_environment(cls):
         """Sample environment config."""
         return EnvironmentConfig(
             name="test", namespace="default", context="test-cluster"
         )
 
-    @pytest.mark.asyncio
-    async def test_successful_script_execution(
-        self, handler, sample_operation, sample_environment
+    @pytest.fixture
+    def empty_environ(self, monkeypatch):
+        """Empty the process environment for the test; monkeypatch restores it."""
+        for key in list(os.environ):
+            monkeypatch.delenv(key)
+        return monkeypatch
+
+    @pytest.mark.parametrize(
+        "mock_process,wait_for_behavior,ok,output,error",
+        [
+            (_MP_HELLO, _WAIT_FOR_HELLO, True, "Hello World\n", None),
+            (_MP_FAIL, _WAIT_FOR_FAILED, False, "", "Command failed\n"),
+            (
+                _MP_TIMEOUT,
+                _WAIT_FOR_TIMEOUT,
+                False,
+                None,
+                "Command timed out after 30 seconds",
+            ),
+        ],
+        ids=["success", "failure", "timeout"],
+        indirect=["wait_for_behavior"],
+    )
+    async def test_script_execution(
+        self,
+        sample_operation,
+        sample_environment,
+        mock_process,
+        wait_for_behavior,
+        ok,
+        output,
+        error,
     ):
-        """Test successful script execution."""
-        mock_process = MockProcess(returncode=0, stdout=b"Hello World\n", stderr=b"")
+        """Test script execution outcomes for success, failure and timeout."""
+        timed_out = wait_for_behavior is _WAIT_FOR_TIMEOUT
+        mock_create = AsyncMock(return_value=mock_process)
+        handler = ScriptHandler(subprocess_factory=mock_create)
 
-        with patch(
-            "asyncio.create_subprocess_shell", return_value=mock_process
-        ) as mock_create:
-            with patch("asyncio.wait_for", return_value=(b"Hello World\n", b"")):
-                result = await handler.execute(sample_operation, sample_environment)
+        result = await handler.execute(sample_operation, sample_environment)
 
-        assert result.success is True
-        assert result.output == "Hello World\n"
-        assert result.error is None
+        assert result.success is ok
+        assert result.output == output
+        assert result.error == error
         assert result.operation == sample_operation
 
         # Verify subprocess was called correctly
@@ -90,57 +282,34 @@ class TestScriptHandler:
             stderr=asyncio.subprocess.PIPE,
             env=handler._prepare_environment(sample_operation, sample_environment),
         )
+        if timed_out:
+            mock_process.kill.assert_called_once()
+            mock_process.wait.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_failed_script_execution(
-        self, handler, sample_operation, sample_environment
-    ):
-        """Test failed script execution."""
-        mock_process = MockProcess(returncode=1, stdout=b"", stderr=b"Command failed\n")
-
-        with patch("asyncio.create_subprocess_shell", return_value=mock_process):
-            with patch("asyncio.wait_for", return_value=(b"", b"Command failed\n")):
-                result = await handler.execute(sample_operation, sample_environment)
-
-        assert result.success is False
-        assert result.output == ""
-        assert result.error == "Command failed\n"
-
-    @pytest.mark.asyncio
-    async def test_script_timeout(self, handler, sample_operation, sample_environment):
-        """Test script execution timeout."""
-        mock_process = MockProcess()
-        mock_process.kill = AsyncMock()
-        mock_process.wait = AsyncMock()
-
-        with patch("asyncio.create_subprocess_shell", return_value=mock_process):
-            with patch("asyncio.wait_for", side_effect=asyncio.TimeoutError()):
-                result = await handler.execute(sample_operation, sample_environment)
-
-        assert result.success is False
-        assert "timed out" in result.error
-        mock_process.kill.assert_called_once()
-        mock_process.wait.assert_called_once()
-
-    @pytest.mark.asyncio
     async def test_script_exception_handling(
-        self, handler, sample_operation, sample_environment
+        self, sample_operation, sample_environment
     ):
         """Test exception handling in script execution."""
-        with patch(
-            "asyncio.create_subprocess_shell", side_effect=OSError("Permission denied")
-        ):
-            result = await handler.execute(sample_operation, sample_environment)
+        handler = ScriptHandler(
+            subprocess_factory=AsyncMock(side_effect=OSError("Permission denied"))
+        )
+
+        result = await handler.execute(sample_operation, sample_environment)
 
         assert result.success is False
         assert result.error == "Permission denied"
 
-    def test_prepare_environment(self, handler, sample_operation, sample_environment):
+    def test_prepare_environment(
+        self, handler, sample_operation, sample_environment, empty_environ
+    ):
         """Test environment variable preparation."""
-        sample_operation.metadata = {"priority": "high", "team": "backend"}
+        operation = sample_operation.model_copy(
+            update={"metadata": {"priority": "high", "team": "backend"}}
+        )
+        empty_environ.setenv("PATH", "/usr/bin")
+        empty_environ.setenv("HOME", "/home/user")
 
-        with patch("os.environ", {"PATH": "/usr/bin", "HOME": "/home/user"}):
-            env = handler._prepare_environment(sample_operation, sample_environment)
+        env = handler._prepare_environment(operation, sample_environment)
 
         # Check original env vars are preserved
         assert env["PATH"] == "/usr/bin"
@@ -156,7 +325,7 @@ class TestScriptHandler:
         assert env["OP_TEAM"] == "backend"
 
     def test_prepare_environment_with_operation_namespace(
-        self, handler, sample_environment
+        self, handler, sample_environment, empty_environ
     ):
         """Test environment preparation with operation-specific namespace."""
         operation = Operation(
@@ -166,8 +335,7 @@ class TestScriptHandler:
             namespace="custom-ns",
         )
 
-        with patch("os.environ", {}):
-            env = handler._prepare_environment(operation, sample_environment)
+        env = handler._prepare_environment(operation, sample_environment)
 
         assert env["NAMESPACE"] == "custom-ns"
 
@@ -175,7 +343,7 @@ class TestScriptHandler:
 class TestKubectlExecHandler:
     """Test KubectlExecHandler class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def handler(self):
         """Create KubectlExecHandler instance."""
         return KubectlExecHandler()
@@ -192,60 +360,66 @@ class TestKubectlExecHandler:
             timeout=60,
         )
 
-    @pytest.fixture
-    def sample_environment(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_environment(cls):
         """Sample environment config."""
         return EnvironmentConfig(
             name="production", namespace="prod", context="prod-cluster"
         )
 
-    @pytest.mark.asyncio
-    async def test_successful_kubectl_exec(
-        self, handler, kubectl_operation, sample_environment
+    @pytest.mark.parametrize(
+        "mock_process,wait_for_behavior,ok,output,error",
+        [
+            (
+                _MP_LISTING,
+                _WAIT_FOR_LISTING,
+                True,
+                _MP_LISTING.stdout.data.decode(),
+                None,
+            ),
+            (_MP_FAIL, _WAIT_FOR_FAILED, False, "", "Command failed\n"),
+            (
+                _MP_TIMEOUT,
+                _WAIT_FOR_TIMEOUT,
+                False,
+                None,
+                "Command timed out after 60 seconds",
+            ),
+        ],
+        ids=["success", "failure", "timeout"],
+        indirect=["wait_for_behavior"],
+    )
+    async def test_kubectl_exec(
+        self,
+        kubectl_operation,
+        sample_environment,
+        mock_process,
+        wait_for_behavior,
+        ok,
+        output,
+        error,
     ):
-        """Test successful kubectl exec."""
-        mock_process = MockProcess(
-            returncode=0,
-            stdout=b"total 4\ndrwxr-xr-x 2 root root 4096 Jan  1 12:00 .\n",
-            stderr=b"",
-        )
+        """Test kubectl exec outcomes for success, failure and timeout."""
+        timed_out = wait_for_behavior is _WAIT_FOR_TIMEOUT
+        mock_create = AsyncMock(return_value=mock_process)
+        handler = KubectlExecHandler(subprocess_factory=mock_create)
 
-        with patch(
-            "asyncio.create_subprocess_exec", return_value=mock_process
-        ) as mock_create:
-            with patch(
-                "asyncio.wait_for", return_value=(mock_process.stdout.data, b"")
-            ):
-                result = await handler.execute(kubectl_operation, sample_environment)
+        result = await handler.execute(kubectl_operation, sample_environment)
 
-        assert result.success is True
-        assert "total 4" in result.output
-        assert result.error is None
+        assert result.success is ok
+        assert result.output == output
+        assert result.error == error
 
         # Verify kubectl command construction
-        expected_cmd = [
-            "kubectl",
-            "--context",
-            "prod-cluster",
-            "exec",
-            "-n",
-            "prod",
-            "web-app",
-            "-c",
-            "app",
-            "--",
-            "sh",
-            "-c",
-            "ls -la",
-        ]
-        mock_create.assert_called_once_with(
-            *expected_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        assert mock_create.call_args_list == [_EXPECTED_EXEC_CALL]
+        if timed_out:
+            mock_process.kill.assert_called_once()
+            mock_process.wait.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_kubectl_exec_without_container(self, handler, sample_environment):
+    async def test_kubectl_exec_without_container(
+        self, sample_environment, monkeypatch
+    ):
         """Test kubectl exec without container specification."""
         operation = Operation(
             command="ps aux",
@@ -254,36 +428,17 @@ class TestKubectlExecHandler:
             service="web-app",
         )
 
-        mock_process = MockProcess(returncode=0, stdout=b"PID USER\n")
+        mock_process = _MP_PS
+        mock_create = AsyncMock(return_value=mock_process)
+        handler = KubectlExecHandler(subprocess_factory=mock_create)
+        monkeypatch.setattr(asyncio, "wait_for", _WAIT_FOR_PS)
 
-        with patch(
-            "asyncio.create_subprocess_exec", return_value=mock_process
-        ) as mock_create:
-            with patch("asyncio.wait_for", return_value=(b"PID USER\n", b"")):
-                result = await handler.execute(operation, sample_environment)
+        result = await handler.execute(operation, sample_environment)
 
         # Verify container flag is not included
         assert result.success is True
-        expected_cmd = [
-            "kubectl",
-            "--context",
-            "prod-cluster",
-            "exec",
-            "-n",
-            "prod",
-            "web-app",
-            "--",
-            "sh",
-            "-c",
-            "ps aux",
-        ]
-        mock_create.assert_called_once_with(
-            *expected_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        assert mock_create.call_args_list == [_EXPECTED_EXEC_NO_CONTAINER_CALL]
 
-    @pytest.mark.asyncio
     async def test_kubectl_exec_missing_service(self, handler, sample_environment):
         """Test kubectl exec with missing service name."""
         operation = Operation(
@@ -295,31 +450,10 @@ class TestKubectlExecHandler:
         assert result.success is False
         assert "Service name required" in result.error
 
-    @pytest.mark.asyncio
-    async def test_kubectl_exec_timeout(
-        self, handler, kubectl_operation, sample_environment
-    ):
-        """Test kubectl exec timeout."""
-        mock_process = MockProcess()
-        mock_process.kill = AsyncMock()
-        mock_process.wait = AsyncMock()
-
-        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
-            with patch("asyncio.wait_for", side_effect=asyncio.TimeoutError()):
-                result = await handler.execute(kubectl_operation, sample_environment)
-
-        assert result.success is False
-        assert "timed out" in result.error
-
 
 class TestKubectlRestartHandler:
     """Test KubectlRestartHandler class."""
 
-    @pytest.fixture
-    def handler(self):
-        """Create KubectlRestartHandler instance."""
-        return KubectlRestartHandler()
-
     @pytest.fixture
     def restart_operation(self):
         """Sample restart operation."""
@@ -332,56 +466,33 @@ class TestKubectlRestartHandler:
             timeout=300,
         )
 
-    @pytest.fixture
-    def sample_environment(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_environment(cls):
         """Sample environment config."""
         return EnvironmentConfig(
             name="staging", namespace="staging", context="staging-cluster"
         )
 
-    @pytest.mark.asyncio
-    async def test_successful_restart(
-        self, handler, restart_operation, sample_environment
-    ):
+    async def test_successful_restart(self, restart_operation, sample_environment):
         """Test successful deployment restart."""
-        mock_process = MockProcess(
-            returncode=0, stdout=b"deployment.apps/web-app restarted\n"
-        )
+        mock_process = _MP_RESTARTED
+        mock_create = AsyncMock(return_value=mock_process)
+        handler = KubectlRestartHandler(subprocess_factory=mock_create)
 
-        with patch(
-            "asyncio.create_subprocess_exec", return_value=mock_process
-        ) as mock_create:
-            with patch.object(
-                handler, "_wait_for_ready", return_value=None
-            ) as mock_wait:
-                result = await handler.execute(restart_operation, sample_environment)
+        with patch.object(handler, "_wait_for_ready", return_value=None) as mock_wait:
+            result = await handler.execute(restart_operation, sample_environment)
 
         assert result.success is True
         assert "restarted" in result.output
 
         # Verify restart command
-        expected_cmd = [
-            "kubectl",
-            "--context",
-            "staging-cluster",
-            "rollout",
-            "restart",
-            "deployment",
-            "web-app",
-            "-n",
-            "staging",
-        ]
-        mock_create.assert_called_once_with(
-            *expected_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        assert mock_create.call_args_list == [_EXPECTED_RESTART_CALL]
 
         # Verify wait for ready was called
         mock_wait.assert_called_once_with("web-app", "staging", "staging-cluster", 300)
 
-    @pytest.mark.asyncio
-    async def test_restart_without_wait_for_ready(self, handler, sample_environment):
+    async def test_restart_without_wait_for_ready(self, sample_environment):
         """Test restart without waiting for ready."""
         operation = Operation(
             command="",
@@ -391,59 +502,53 @@ class TestKubectlRestartHandler:
             wait_for_ready=False,
         )
 
-        mock_process = MockProcess(
-            returncode=0, stdout=b"deployment.apps/api restarted\n"
+        mock_process = _MP_API_RESTARTED
+        handler = KubectlRestartHandler(
+            subprocess_factory=AsyncMock(return_value=mock_process)
         )
 
-        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
-            with patch.object(handler, "_wait_for_ready") as mock_wait:
-                result = await handler.execute(operation, sample_environment)
+        with patch.object(handler, "_wait_for_ready") as mock_wait:
+            result = await handler.execute(operation, sample_environment)
 
         assert result.success is True
         mock_wait.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_restart_failure(
-        self, handler, restart_operation, sample_environment
-    ):
+    async def test_restart_failure(self, restart_operation, sample_environment):
         """Test failed restart."""
-        mock_process = MockProcess(
-            returncode=1, stderr=b"deployment 'web-app' not found"
+        mock_process = _MP_NOT_FOUND
+        handler = KubectlRestartHandler(
+            subprocess_factory=AsyncMock(return_value=mock_process)
         )
 
-        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
-            result = await handler.execute(restart_operation, sample_environment)
+        result = await handler.execute(restart_operation, sample_environment)
 
         assert result.success is False
         assert "not found" in result.error
 
-    @pytest.mark.asyncio
-    async def test_wait_for_ready_success(self, handler):
+    async def test_wait_for_ready_success(self):
         """Test successful wait for ready."""
-        mock_process = MockProcess(returncode=0)
+        mock_process = _MP_OK
+        handler = KubectlRestartHandler(
+            subprocess_factory=AsyncMock(return_value=mock_process)
+        )
 
-        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
-            # Should not raise exception
-            await handler._wait_for_ready("web-app", "default", "test-context", 300)
+        # Should not raise exception
+        await handler._wait_for_ready("web-app", "default", "test-context", 300)
 
-    @pytest.mark.asyncio
-    async def test_wait_for_ready_timeout(self, handler):
+    async def test_wait_for_ready_timeout(self):
         """Test wait for ready timeout."""
-        mock_process = MockProcess(returncode=1)
+        mock_process = _MP_ERROR
+        handler = KubectlRestartHandler(
+            subprocess_factory=AsyncMock(return_value=mock_process)
+        )
 
-        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
-            with pytest.raises(Exception, match="did not become ready"):
-                await handler._wait_for_ready("web-app", "default", None, 60)
+        with pytest.raises(Exception, match="did not become ready"):
+            await handler._wait_for_ready("web-app", "default", None, 60)
 
 
 class TestKubectlApplyHandler:
     """Test KubectlApplyHandler class."""
 
-    @pytest.fixture
-    def handler(self):
-        """Create KubectlApplyHandler instance."""
-        return KubectlApplyHandler()
-
     @pytest.fixture
     def apply_file_operation(self):
         """Sample apply operation with file path."""
@@ -463,54 +568,33 @@ class TestKubectlApplyHandler:
             type=OperationType.KUBECTL_APPLY,
         )
 
-    @pytest.fixture
-    def sample_environment(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_environment(cls):
         """Sample environment config."""
         return EnvironmentConfig(name="test", namespace="test-ns")
 
-    @pytest.mark.asyncio
-    async def test_apply_from_file(
-        self, handler, apply_file_operation, sample_environment
-    ):
+    async def test_apply_from_file(self, apply_file_operation, sample_environment):
         """Test applying from file path."""
-        mock_process = MockProcess(
-            returncode=0, stdout=b"deployment.apps/web-app created\n"
-        )
+        mock_process = _MP_CREATED
+        mock_create = AsyncMock(return_value=mock_process)
+        handler = KubectlApplyHandler(subprocess_factory=mock_create)
 
-        with patch(
-            "asyncio.create_subprocess_exec", return_value=mock_process
-        ) as mock_create:
-            result = await handler.execute(apply_file_operation, sample_environment)
+        result = await handler.execute(apply_file_operation, sample_environment)
 
         assert result.success is True
         assert "created" in result.output
 
         # Verify command construction
-        expected_cmd = [
-            "kubectl",
-            "apply",
-            "-n",
-            "test-ns",
-            "-f",
-            "manifests/deployment.yaml",
-        ]
-        mock_create.assert_called_once_with(
-            *expected_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        assert mock_create.call_args_list == [_EXPECTED_APPLY_CALL]
 
-    @pytest.mark.asyncio
-    async def test_apply_inline_yaml(
-        self, handler, apply_yaml_operation, sample_environment
-    ):
+    async def test_apply_inline_yaml(self, apply_yaml_operation, sample_environment):
         """Test applying inline YAML."""
-        mock_process = MockProcess(returncode=0, stdout=b"configmap/test created\n")
+        mock_process = _MP_CONFIGMAP_CREATED
+        mock_create = AsyncMock(return_value=mock_process)
+        handler = KubectlApplyHandler(subprocess_factory=mock_create)
 
-        with patch(
-            "asyncio.create_subprocess_exec", return_value=mock_process
-        ) as mock_create:
-            result = await handler.execute(apply_yaml_operation, sample_environment)
+        result = await handler.execute(apply_yaml_operation, sample_environment)
 
         assert result.success is True
 
@@ -521,43 +605,27 @@ class TestKubectlApplyHandler:
         assert list(args) == expected_cmd
         assert kwargs["stdin"] == asyncio.subprocess.PIPE
 
-    @pytest.mark.asyncio
-    async def test_apply_with_context(self, handler, apply_file_operation):
+    async def test_apply_with_context(self, apply_file_operation):
         """Test apply with Kubernetes context."""
         environment = EnvironmentConfig(
             name="prod", namespace="production", context="prod-cluster"
         )
 
-        mock_process = MockProcess(returncode=0, stdout=b"applied\n")
+        mock_process = _MP_APPLIED
+        mock_create = AsyncMock(return_value=mock_process)
+        handler = KubectlApplyHandler(subprocess_factory=mock_create)
 
-        with patch(
-            "asyncio.create_subprocess_exec", return_value=mock_process
-        ) as mock_create:
-            result = await handler.execute(apply_file_operation, environment)
+        result = await handler.execute(apply_file_operation, environment)
 
         # Verify context is included
         assert result.success is True
-        expected_cmd = [
-            "kubectl",
-            "--context",
-            "prod-cluster",
-            "apply",
-            "-n",
-            "production",
-            "-f",
-            "manifests/deployment.yaml",
-        ]
-        mock_create.assert_called_once_with(
-            *expected_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        assert mock_create.call_args_list == [_EXPECTED_APPLY_CONTEXT_CALL]
 
 
 class TestHttpRequestHandler:
     """Test HttpRequestHandler class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def handler(self):
         """Create HttpRequestHandler instance."""
         return HttpRequestHandler()
@@ -566,7 +634,7 @@ class TestHttpRequestHandler:
     def http_get_operation(self):
         """Sample HTTP GET operation."""
         return Operation(
-            command='{"url": "http://api.example.com/health", "method": "GET"}',
+            command=_GET_CMD,
             description="Health check API",
             type=OperationType.HTTP_REQUEST,
             timeout=30,
@@ -576,69 +644,81 @@ class TestHttpRequestHandler:
     def http_post_operation(self):
         """Sample HTTP POST operation."""
         return Operation(
-            command='{"url": "http://api.example.com/deploy", "method": "POST", "data": {"version": "1.0.0"}}',
+            command=_POST_CMD,
             description="Deploy API call",
             type=OperationType.HTTP_REQUEST,
             timeout=60,
         )
 
-    @pytest.fixture
-    def sample_environment(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_environment(cls):
         """Sample environment config."""
         return EnvironmentConfig(name="test", namespace="default")
 
-    @pytest.mark.asyncio
-    async def test_successful_http_get(
-        self, handler, http_get_operation, sample_environment
-    ):
-        """Test successful HTTP GET request."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def aio_mock(cls):
+        """Mock aiohttp responses for the whole class."""
         with aioresponses() as mock_responses:
-            mock_responses.get(
-                "http://api.example.com/health", payload={"status": "ok"}
-            )
-
-            result = await handler.execute(http_get_operation, sample_environment)
-
-        assert result.success is True
-        assert '{"status": "ok"}' in result.output
-        assert result.metadata["status_code"] == 200
-
-    @pytest.mark.asyncio
-    async def test_successful_http_post(
-        self, handler, http_post_operation, sample_environment
+            yield mock_responses
+
+    @pytest.fixture(autouse=True)
+    def _clear_aio_mock(self, aio_mock):
+        """Drop responses and requests registered during the test."""
+        yield
+        aio_mock.clear()
+
+    async def test_http_responses(
+        self,
+        handler,
+        http_get_operation,
+        http_post_operation,
+        sample_environment,
+        aio_mock,
     ):
-        """Test successful HTTP POST request."""
-        with aioresponses() as mock_responses:
-            mock_responses.post(
-                "http://api.example.com/deploy",
-                payload={"result": "success"},
-                status=201,
-            )
+        """Test success, error and connection-failure responses in one batch."""
+        error_operation = http_get_operation.model_copy(update={"command": _ERROR_CMD})
+        unreachable_operation = http_get_operation.model_copy(
+            update={"command": _UNREACHABLE_CMD}
+        )
 
-            result = await handler.execute(http_post_operation, sample_environment)
+        aio_mock.get("http://api.example.com/health", payload={"status": "ok"})
+        aio_mock.post(
+            "http://api.example.com/deploy",
+            payload={"result": "success"},
+            status=201,
+        )
+        aio_mock.get(
+            "http://api.example.com/error",
+            status=500,
+            payload={"error": "Internal server error"},
+        )
+        # No mock for the unreachable URL - will cause connection error
+
+        get_result, post_result, error_result, unreachable_result = (
+            await asyncio.gather(
+                handler.execute(http_get_operation, sample_environment),
+                handler.execute(http_post_operation, sample_environment),
+                handler.execute(error_operation, sample_environment),
+                handler.execute(unreachable_operation, sample_environment),
+            )
+        )
 
-        assert result.success is True
-        assert result.metadata["status_code"] == 201
+        assert get_result.success is True
+        assert '{"status": "ok"}' in get_result.output
+        assert get_result.metadata["status_code"] == 200
 
-    @pytest.mark.asyncio
-    async def test_http_error_response(
-        self, handler, http_get_operation, sample_environment
-    ):
-        """Test HTTP error response."""
-        with aioresponses() as mock_responses:
-            mock_responses.get(
-                "http://api.example.com/health",
-                status=500,
-                payload={"error": "Internal server error"},
-            )
+        assert post_result.success is True
+        assert post_result.metadata["status_code"] == 201
 
-            result = await handler.execute(http_get_operation, sample_environment)
+        assert error_result.success is False
+        assert error_result.error == "HTTP 500"
+        assert error_result.metadata["status_code"] == 500
 
-        assert result.success is False
-        assert result.error == "HTTP 500"
-        assert result.metadata["status_code"] == 500
+        assert unreachable_result.success is False
+        assert unreachable_result.error is not None
 
-    @pytest.mark.asyncio
     async def test_invalid_json_command(self, handler, sample_environment):
         """Test handling of invalid JSON in command."""
         operation = Operation(
@@ -652,49 +732,41 @@ class TestHttpRequestHandler:
         assert result.success is False
         assert "Invalid JSON" in result.error
 
-    @pytest.mark.asyncio
-    async def test_http_connection_error(
-        self, handler, http_get_operation, sample_environment
-    ):
-        """Test HTTP connection error."""
-        # No mock response - will cause connection error
-        result = await handler.execute(http_get_operation, sample_environment)
-
-        assert result.success is False
-        assert result.error is not None
-
 
 class TestHandlerRegistry:
     """Test HandlerRegistry class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def registry(self):
         """Create HandlerRegistry instance."""
         return HandlerRegistry()
 
+    @pytest.fixture(autouse=True)
+    def _reset_registry(self, registry):
+        """Start every test with an empty shared registry."""
+        registry._handlers.clear()
+
     @pytest.fixture
-    def mock_handler(self):
-        """Create mock handler."""
-        handler = Mock(spec=OperationHandler)
-        handler.execute = AsyncMock()
-        return handler
+    def stub_handler(self):
+        """Create stub handler."""
+        return _StubHandler()
 
-    def test_register_handler(self, registry, mock_handler):
+    def test_register_handler(self, registry, stub_handler):
         """Test registering a handler."""
-        registry.register(OperationType.SCRIPT_EXEC, mock_handler)
+        registry.register(OperationType.SCRIPT_EXEC, stub_handler)
 
         retrieved = registry.get_handler(OperationType.SCRIPT_EXEC)
-        assert retrieved == mock_handler
+        assert retrieved is stub_handler
 
     def test_get_nonexistent_handler(self, registry):
         """Test getting handler that doesn't exist."""
         handler = registry.get_handler(OperationType.CUSTOM)
         assert handler is None
 
-    def test_unregister_handler(self, registry, mock_handler):
+    def test_unregister_handler(self, registry, stub_handler):
         """Test unregistering a handler."""
-        registry.register(OperationType.HTTP_REQUEST, mock_handler)
-        assert registry.get_handler(OperationType.HTTP_REQUEST) == mock_handler
+        registry.register(OperationType.HTTP_REQUEST, stub_handler)
+        assert registry.get_handler(OperationType.HTTP_REQUEST) is stub_handler
 
         registry.unregister(OperationType.HTTP_REQUEST)
         assert registry.get_handler(OperationType.HTTP_REQUEST) is None
@@ -706,22 +778,22 @@ class TestHandlerRegistry:
 
     def test_multiple_handlers(self, registry):
         """Test registering multiple handlers."""
-        script_handler = Mock(spec=OperationHandler)
-        http_handler = Mock(spec=OperationHandler)
+        script_handler = _StubHandler()
+        http_handler = _StubHandler()
 
         registry.register(OperationType.SCRIPT_EXEC, script_handler)
         registry.register(OperationType.HTTP_REQUEST, http_handler)
 
-        assert registry.get_handler(OperationType.SCRIPT_EXEC) == script_handler
-        assert registry.get_handler(OperationType.HTTP_REQUEST) == http_handler
+        assert registry.get_handler(OperationType.SCRIPT_EXEC) is script_handler
+        assert registry.get_handler(OperationType.HTTP_REQUEST) is http_handler
 
     def test_handler_replacement(self, registry):
         """Test replacing an existing handler."""
-        old_handler = Mock(spec=OperationHandler)
-        new_handler = Mock(spec=OperationHandler)
+        old_handler = _StubHandler()
+        new_handler = _StubHandler()
 
         registry.register(OperationType.KUBECTL_EXEC, old_handler)
         registry.register(OperationType.KUBECTL_EXEC, new_handler)
 
         # Should return the new handler
-        assert registry.get_handler(OperationType.KUBECTL_EXEC) == new_handler
+        assert registry.get_handler(OperationType.KUBECTL_EXEC) is new_handler
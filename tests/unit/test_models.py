@@ -1,7 +1,12 @@
 """
 Unit tests for phazr.models module.
+
+Tests here are independent and fixtures are read-only, so the module can be
+distributed across workers: ``pytest -n auto tests/unit/test_models.py``.
 """
 
+from types import MappingProxyType
+
 import pytest
 from pydantic import ValidationError
 
@@ -17,25 +22,57 @@ from phazr.models import (
     VersionConfig,
 )
 
+pytestmark = pytest.mark.filterwarnings("error")
+
+# Read-only metadata shared by the tests below
+_META_FULL_OP = MappingProxyType({"env": "test", "priority": "high"})
+_META_EXEC_RESULT = MappingProxyType({"exit_code": 0})
+_META_VERSION = MappingProxyType({"branch": "main"})
+_META_FULL_ENV = MappingProxyType({"region": "us-west-2", "env_type": "staging"})
+_META_ORCHESTRATOR = MappingProxyType({"created_by": "test"})
+
+
+# Prototype for script operations; clone with model_copy(update=...) and put only
+# the fields a test cares about in ``update``.
+_OP_TEMPLATE = Operation.model_construct(
+    command="", description="", type=OperationType.SCRIPT_EXEC
+)
+
+
+@pytest.fixture(scope="session")
+def make_script_op():
+    """Factory for trusted script operations, cloned from ``_OP_TEMPLATE``."""
+
+    def _make(command, description, **kwargs):
+        # deep=True so clones never share the template's metadata dict
+        return _OP_TEMPLATE.model_copy(
+            update={"command": command, "description": description, **kwargs},
+            deep=True,
+        )
+
+    return _make
+
 
 class TestOperationType:
     """Test OperationType enum."""
 
-    def test_operation_type_values(self):
-        """Test that all operation types have expected values."""
-        assert OperationType.SCRIPT_EXEC == "script_exec"
-        assert OperationType.KUBECTL_EXEC == "kubectl_exec"
-        assert OperationType.KUBECTL_RESTART == "kubectl_restart"
-        assert OperationType.KUBECTL_APPLY == "kubectl_apply"
-        assert OperationType.KUBECTL_DELETE == "kubectl_delete"
-        assert OperationType.HTTP_REQUEST == "http_request"
-        assert OperationType.CUSTOM == "custom"
-        assert OperationType.SKIP == "skip"
-
-    def test_operation_type_string_conversion(self):
-        """Test operation type can be created from string."""
-        assert OperationType("script_exec") == OperationType.SCRIPT_EXEC
-        assert OperationType("kubectl_exec") == OperationType.KUBECTL_EXEC
+    @pytest.mark.parametrize(
+        "name,value",
+        [
+            ("SCRIPT_EXEC", "script_exec"),
+            ("KUBECTL_EXEC", "kubectl_exec"),
+            ("KUBECTL_RESTART", "kubectl_restart"),
+            ("KUBECTL_APPLY", "kubectl_apply"),
+            ("KUBECTL_DELETE", "kubectl_delete"),
+            ("HTTP_REQUEST", "http_request"),
+            ("CUSTOM", "custom"),
+            ("SKIP", "skip"),
+        ],
+    )
+    def test_enum_member(self, name, value):
+        """Test each operation type's value and construction from string."""
+        assert OperationType[name].value == value
+        assert OperationType(value) is OperationType[name]
 
 
 class TestPhase:
@@ -78,11 +115,9 @@ class TestPhase:
 
     def test_phase_name_required(self):
         """Test that phase name is required."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match=r"(?m)^name$"):
             Phase()
 
-        assert "name" in str(exc_info.value)
-
 
 class TestOperation:
     """Test Operation model."""
@@ -110,8 +145,6 @@ class TestOperation:
 
     def test_full_operation_creation(self):
         """Test creating operation with all fields."""
-        metadata = {"env": "test", "priority": "high"}
-
         operation = Operation(
             command="kubectl get pods",
             description="List pods",
@@ -127,7 +160,7 @@ class TestOperation:
             retry_delay=10,
             skip_if="test -f /skip",
             fail_on_error=False,
-            metadata=metadata,
+            metadata=_META_FULL_OP,
         )
 
         assert operation.command == "kubectl get pods"
@@ -140,24 +173,23 @@ class TestOperation:
         assert operation.retry_delay == 10
         assert operation.skip_if == "test -f /skip"
         assert operation.fail_on_error is False
-        assert operation.metadata == metadata
-
-    def test_required_fields_validation(self):
+        assert operation.metadata == _META_FULL_OP
+
+    @pytest.mark.parametrize(
+        "kwargs,field",
+        [
+            ({"description": "Test", "type": OperationType.SCRIPT_EXEC}, "command"),
+            (
+                {"command": "echo test", "type": OperationType.SCRIPT_EXEC},
+                "description",
+            ),
+            ({"command": "echo test", "description": "Test"}, "type"),
+        ],
+    )
+    def test_required_fields_validation(self, kwargs, field):
         """Test that required fields are validated."""
-        # Missing command
-        with pytest.raises(ValidationError) as exc_info:
-            Operation(description="Test", type=OperationType.SCRIPT_EXEC)
-        assert "command" in str(exc_info.value)
-
-        # Missing description
-        with pytest.raises(ValidationError) as exc_info:
-            Operation(command="echo test", type=OperationType.SCRIPT_EXEC)
-        assert "description" in str(exc_info.value)
-
-        # Missing type
-        with pytest.raises(ValidationError) as exc_info:
-            Operation(command="echo test", description="Test")
-        assert "type" in str(exc_info.value)
+        with pytest.raises(ValidationError, match=rf"(?m)^{field}$"):
+            Operation(**kwargs)
 
     def test_operation_type_validation(self):
         """Test operation type validation."""
@@ -177,13 +209,9 @@ class TestOperation:
 class TestExecutionResult:
     """Test ExecutionResult model."""
 
-    def test_execution_result_creation(self):
+    def test_execution_result_creation(self, make_script_op):
         """Test creating execution result."""
-        operation = Operation(
-            command="echo test",
-            description="Test command",
-            type=OperationType.SCRIPT_EXEC,
-        )
+        operation = make_script_op("echo test", "Test command")
 
         result = ExecutionResult(
             operation=operation,
@@ -193,25 +221,21 @@ class TestExecutionResult:
             duration=1.5,
             timestamp="2023-01-01T12:00:00Z",
             retries_used=0,
-            metadata={"exit_code": 0},
+            metadata=_META_EXEC_RESULT,
         )
 
-        assert result.operation == operation
+        assert result.operation is operation
         assert result.success is True
         assert result.output == "test output"
         assert result.error is None
         assert result.duration == 1.5
         assert result.timestamp == "2023-01-01T12:00:00Z"
         assert result.retries_used == 0
-        assert result.metadata == {"exit_code": 0}
+        assert result.metadata == _META_EXEC_RESULT
 
-    def test_execution_result_defaults(self):
+    def test_execution_result_defaults(self, make_script_op):
         """Test execution result default values."""
-        operation = Operation(
-            command="echo test",
-            description="Test command",
-            type=OperationType.SCRIPT_EXEC,
-        )
+        operation = make_script_op("echo test", "Test command")
 
         result = ExecutionResult(operation=operation, success=False)
 
@@ -226,33 +250,30 @@ class TestExecutionResult:
 class TestPhaseResult:
     """Test PhaseResult model."""
 
-    @pytest.fixture
-    def sample_operations(self):
+    @pytest.fixture(scope="module")
+    def sample_operations(self, make_script_op):
         """Sample operations for testing."""
-        return [
-            Operation(
-                command="echo 1", description="Op 1", type=OperationType.SCRIPT_EXEC
-            ),
-            Operation(
-                command="echo 2", description="Op 2", type=OperationType.SCRIPT_EXEC
-            ),
-            Operation(
-                command="echo 3", description="Op 3", type=OperationType.SCRIPT_EXEC
-            ),
-        ]
+        return [make_script_op(f"echo {i}", f"Op {i}") for i in (1, 2, 3)]
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_results(self, sample_operations):
         """Sample execution results."""
         return [
-            ExecutionResult(operation=sample_operations[0], success=True),
-            ExecutionResult(operation=sample_operations[1], success=True),
-            ExecutionResult(operation=sample_operations[2], success=False),
+            ExecutionResult.model_construct(
+                operation=sample_operations[0], success=True
+            ),
+            ExecutionResult.model_construct(
+                operation=sample_operations[1], success=True
+            ),
+            ExecutionResult.model_construct(
+                operation=sample_operations[2], success=False
+            ),
         ]
 
-    def test_phase_result_creation(self, sample_results):
-        """Test creating phase result."""
-        phase_result = PhaseResult(
+    @pytest.fixture(scope="module")
+    def phase_result_3ops(self, sample_results):
+        """Phase result with two of three operations successful."""
+        return PhaseResult(
             phase_name="test_phase",
             version="1.0.0",
             results=sample_results,
@@ -263,28 +284,20 @@ class TestPhaseResult:
             duration=5.5,
         )
 
-        assert phase_result.phase_name == "test_phase"
-        assert phase_result.version == "1.0.0"
-        assert len(phase_result.results) == 3
-        assert phase_result.total_operations == 3
-        assert phase_result.successful_operations == 2
-        assert phase_result.failed_operations == 1
-        assert phase_result.skipped_operations == 0
-        assert phase_result.duration == 5.5
-
-    def test_success_rate_calculation(self, sample_results):
+    def test_phase_result_creation(self, phase_result_3ops):
+        """Test creating phase result."""
+        assert phase_result_3ops.phase_name == "test_phase"
+        assert phase_result_3ops.version == "1.0.0"
+        assert len(phase_result_3ops.results) == 3
+        assert phase_result_3ops.total_operations == 3
+        assert phase_result_3ops.successful_operations == 2
+        assert phase_result_3ops.failed_operations == 1
+        assert phase_result_3ops.skipped_operations == 0
+        assert phase_result_3ops.duration == 5.5
+
+    def test_success_rate_calculation(self, phase_result_3ops):
         """Test success rate calculation."""
-        phase_result = PhaseResult(
-            phase_name="test",
-            version="1.0.0",
-            results=sample_results,
-            total_operations=3,
-            successful_operations=2,
-            failed_operations=1,
-            skipped_operations=0,
-        )
-
-        assert abs(phase_result.success_rate - 66.66666666666667) < 0.001
+        assert phase_result_3ops.success_rate * 3 == pytest.approx(200.0)
 
     def test_success_rate_with_zero_operations(self):
         """Test success rate with zero operations."""
@@ -300,19 +313,10 @@ class TestPhaseResult:
 
         assert phase_result.success_rate == 100.0
 
-    def test_is_successful_property(self, sample_results):
+    def test_is_successful_property(self, phase_result_3ops):
         """Test is_successful property."""
         # Failed phase
-        failed_phase = PhaseResult(
-            phase_name="test",
-            version="1.0.0",
-            results=sample_results,
-            total_operations=3,
-            successful_operations=2,
-            failed_operations=1,
-            skipped_operations=0,
-        )
-        assert failed_phase.is_successful is False
+        assert phase_result_3ops.is_successful is False
 
         # Successful phase
         successful_phase = PhaseResult(
@@ -334,14 +338,14 @@ class TestVersionConfig:
         """Test creating version config."""
         operations = {
             "build": [
-                Operation(
+                Operation.model_construct(
                     command="make build",
                     description="Build",
                     type=OperationType.SCRIPT_EXEC,
                 )
             ],
             "test": [
-                Operation(
+                Operation.model_construct(
                     command="make test",
                     description="Test",
                     type=OperationType.SCRIPT_EXEC,
@@ -350,16 +354,16 @@ class TestVersionConfig:
         }
 
         config = VersionConfig(
-            version="1.0.0", groups=operations, metadata={"branch": "main"}
+            version="1.0.0", groups=operations, metadata=_META_VERSION
         )
 
         assert config.version == "1.0.0"
         assert config.groups == operations
-        assert config.metadata == {"branch": "main"}
+        assert config.metadata == _META_VERSION
 
     def test_empty_group_validation(self):
         """Test that empty groups are not allowed."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="Group 'build' cannot be empty"):
             VersionConfig(
                 version="1.0.0",
                 groups={
@@ -374,8 +378,6 @@ class TestVersionConfig:
                 },
             )
 
-        assert "Group 'build' cannot be empty" in str(exc_info.value)
-
 
 class TestEnvironmentConfig:
     """Test EnvironmentConfig model."""
@@ -392,21 +394,19 @@ class TestEnvironmentConfig:
 
     def test_full_environment_config(self):
         """Test creating environment config with all fields."""
-        metadata = {"region": "us-west-2", "env_type": "staging"}
-
         config = EnvironmentConfig(
             name="staging",
             namespace="staging-ns",
             context="staging-cluster",
             cluster="cluster-west",
-            metadata=metadata,
+            metadata=_META_FULL_ENV,
         )
 
         assert config.name == "staging"
         assert config.namespace == "staging-ns"
         assert config.context == "staging-cluster"
         assert config.cluster == "cluster-west"
-        assert config.metadata == metadata
+        assert config.metadata == _META_FULL_ENV
 
 
 class TestExecutionConfig:
@@ -448,48 +448,49 @@ class TestExecutionConfig:
 class TestOrchestratorConfig:
     """Test OrchestratorConfig model."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_version_config(self):
         """Sample version configuration."""
         operations = {
             "build": [
-                Operation(
+                Operation.model_construct(
                     command="make", description="Build", type=OperationType.SCRIPT_EXEC
                 )
             ]
         }
-        return VersionConfig(version="1.0.0", groups=operations)
+        return VersionConfig.model_construct(version="1.0.0", groups=operations)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_phases(self):
         """Sample phases."""
         return [
-            Phase(name="build", groups=["build"]),
-            Phase(name="test", groups=["test"], depends_on=["build"]),
+            Phase.model_construct(name="build", groups=["build"]),
+            Phase.model_construct(name="test", groups=["test"], depends_on=["build"]),
         ]
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_environment(self):
         """Sample environment."""
-        return EnvironmentConfig(name="test", namespace="default")
+        return EnvironmentConfig.model_construct(name="test", namespace="default")
 
     def test_orchestrator_config_creation(
         self, sample_version_config, sample_phases, sample_environment
     ):
         """Test creating orchestrator config."""
+        versions = {"1.0.0": sample_version_config}
         config = OrchestratorConfig(
-            versions={"1.0.0": sample_version_config},
+            versions=versions,
             phases=sample_phases,
             environment=sample_environment,
             execution=ExecutionConfig(verbose=True),
-            metadata={"created_by": "test"},
+            metadata=_META_ORCHESTRATOR,
         )
 
-        assert config.versions == {"1.0.0": sample_version_config}
+        assert config.versions == versions
         assert config.phases == sample_phases
-        assert config.environment == sample_environment
+        assert config.environment is sample_environment
         assert config.execution.verbose is True
-        assert config.metadata == {"created_by": "test"}
+        assert config.metadata == _META_ORCHESTRATOR
 
     def test_orchestrator_config_defaults(
         self, sample_version_config, sample_environment
@@ -503,16 +504,17 @@ class TestOrchestratorConfig:
         assert isinstance(config.execution, ExecutionConfig)
         assert config.metadata == {}
 
-    def test_required_fields_validation(self):
+    @pytest.mark.parametrize(
+        "kwargs,field",
+        [
+            (
+                {"environment": EnvironmentConfig(name="test", namespace="default")},
+                "versions",
+            ),
+            ({"versions": {}}, "environment"),
+        ],
+    )
+    def test_required_fields_validation(self, kwargs, field):
         """Test that required fields are validated."""
-        # Missing versions
-        with pytest.raises(ValidationError) as exc_info:
-            OrchestratorConfig(
-                environment=EnvironmentConfig(name="test", namespace="default")
-            )
-        assert "versions" in str(exc_info.value)
-
-        # Missing environment
-        with pytest.raises(ValidationError) as exc_info:
-            OrchestratorConfig(versions={})
-        assert "environment" in str(exc_info.value)
+        with pytest.raises(ValidationError, match=rf"(?m)^{field}$"):
+            OrchestratorConfig(**kwargs)
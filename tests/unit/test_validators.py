@@ -1,11 +1,18 @@
 """
 Unit tests for prerequisite validators - focused on behavior verification.
+
+Mocks are created per test and the filesystem is faked, so the module can run
+on xdist workers: ``pytest -n auto --dist=loadfile tests/unit/test_validators.py``.
 """
 import asyncio
-import tempfile
-from unittest.mock import AsyncMock, patch
+import os
+import shutil
+import stat
+from unittest.mock import AsyncMock
 
+import aiohttp
 import pytest
+from aioresponses import aioresponses
 
 from phazr.validators import (
     FileSystemValidator,
@@ -14,8 +21,8 @@ from phazr.validators import (
     PrerequisiteValidator,
     ToolValidator,
     Validator,
+    _max_processes_from_env,
 )
-from phazr.models import EnvironmentConfig
 
 
 class MockValidator(Validator):
@@ -28,6 +35,45 @@ class MockValidator(Validator):
         return self.result
 
 
+# MockValidator only hands back its canned result, so instances can be shared
+_PASS = MockValidator({"status": "passed"})
+_WARN = MockValidator({"status": "warning"})
+_FAIL = MockValidator({"status": "failed"})
+
+
+def _tool_stub(status):
+    """tool_validator_factory stand-in reporting every tool with one status."""
+    return lambda tool: MockValidator({"status": status, "tool": tool})
+
+
+_DIR, _FILE = stat.S_IFDIR, stat.S_IFREG
+
+
+def _fake_stat(tree):
+    """os.stat stand-in that only knows the paths in a {path: file type} map."""
+
+    def fake(path, *args, **kwargs):
+        if path not in tree:
+            raise FileNotFoundError(path)
+        return os.stat_result((tree[path],) + (0,) * 9)
+
+    return fake
+
+
+@pytest.fixture(autouse=True)
+def _no_real_subprocesses(monkeypatch):
+    """Fail any test that reaches asyncio instead of an injected subprocess factory.
+
+    Validators swallow spawn errors into their results, so the stand-in records
+    calls and the check happens after the test.
+    """
+    spawn = AsyncMock(side_effect=AssertionError("real subprocess spawned"))
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", spawn)
+    monkeypatch.setattr(asyncio, "create_subprocess_shell", spawn)
+    yield
+    spawn.assert_not_called()
+
+
 class TestValidator:
     """Test base Validator abstract class."""
 
@@ -40,6 +86,18 @@ class TestValidator:
 class TestToolValidator:
     """Test ToolValidator behavior for checking tool availability."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_version_cache(self):
+        """Start each test with no cached version probes."""
+        ToolValidator.clear_cache()
+        yield
+        ToolValidator.clear_cache()
+
+    @pytest.fixture(autouse=True)
+    def _tools_on_path(self, monkeypatch):
+        """Resolve every tool on PATH unless a test says otherwise."""
+        monkeypatch.setattr(shutil, "which", lambda cmd: f"/usr/bin/{cmd}")
+
     def test_tool_validator_configures_version_command_automatically(self):
         """Test that ToolValidator automatically configures version command."""
         validator = ToolValidator("kubectl")
@@ -52,90 +110,154 @@ class TestToolValidator:
         assert validator.tool_name == "python"
         assert validator.version_command == "python --version"
 
-    @pytest.mark.asyncio
-    async def test_tool_validation_detects_available_tool(self):
-        """Test that tool validation correctly identifies available tools."""
-        validator = ToolValidator("echo")  # echo should be available on most systems
-
-        with patch("asyncio.create_subprocess_shell") as mock_subprocess:
-            mock_process = AsyncMock()
-            mock_process.returncode = 0
-            mock_process.communicate.return_value = (b"version 1.0\n", b"")
-            mock_subprocess.return_value = mock_process
-
-            with patch("asyncio.wait_for", return_value=(b"version 1.0\n", b"")):
-                result = await validator.validate()
-
-            assert result["status"] == "passed"
-            assert result["tool"] == "echo"
-            assert "version 1.0" in result["version"]
-            assert "is available" in result["message"]
-
-    @pytest.mark.asyncio
-    async def test_tool_validation_handles_version_in_stderr(self):
-        """Test that tool validation handles version output in stderr."""
-        validator = ToolValidator("test-tool")
-
-        with patch("asyncio.create_subprocess_shell") as mock_subprocess:
-            mock_process = AsyncMock()
-            mock_process.returncode = 0
-            mock_process.communicate.return_value = (b"", b"version 2.0\n")
-            mock_subprocess.return_value = mock_process
-
-            with patch("asyncio.wait_for", return_value=(b"", b"version 2.0\n")):
-                result = await validator.validate()
-
-            assert result["status"] == "passed"
-            assert "version 2.0" in result["version"]
-
-    @pytest.mark.asyncio
-    async def test_tool_validation_detects_unavailable_tool(self):
-        """Test that tool validation correctly identifies unavailable tools."""
-        validator = ToolValidator("nonexistent-tool")
-
-        with patch("asyncio.create_subprocess_shell") as mock_subprocess:
-            mock_process = AsyncMock()
-            mock_process.returncode = 1
-            mock_subprocess.return_value = mock_process
-
-            with patch("asyncio.wait_for", return_value=(b"", b"command not found")):
-                result = await validator.validate()
-
-            assert result["status"] == "failed"
-            assert result["tool"] == "nonexistent-tool"
-            assert "command failed" in result["message"]
-
-    @pytest.mark.asyncio
-    async def test_tool_validation_handles_timeout_gracefully(self):
+    @pytest.mark.parametrize(
+        "returncode,stdout,stderr,status,message",
+        [
+            (0, b"version 1.0\n", b"", "passed", "is available"),
+            (0, b"", b"version 2.0\n", "passed", "is available"),
+            (1, b"", b"command not found", "failed", "command failed"),
+        ],
+        ids=["version_in_stdout", "version_in_stderr", "command_failed"],
+    )
+    async def test_tool_validation_reports_probe_outcome(
+        self, make_proc, returncode, stdout, stderr, status, message
+    ):
+        """Test that tool validation reports the version probe's outcome."""
+        mock_subprocess = AsyncMock(return_value=make_proc(returncode, stdout, stderr))
+        validator = ToolValidator("echo", subprocess_factory=mock_subprocess)
+
+        result = await validator.validate()
+
+        assert result["status"] == status
+        assert result["tool"] == "echo"
+        assert message in result["message"]
+        assert mock_subprocess.call_args.args == ("echo", "--version")
+        if status == "passed":
+            assert result["version"] == (stdout or stderr).decode().strip()
+
+    async def test_tool_validation_fails_fast_when_tool_not_on_path(self, monkeypatch):
+        """Test that a tool missing from PATH is reported without spawning."""
+        monkeypatch.setattr(shutil, "which", lambda cmd: None)
+        mock_subprocess = AsyncMock()
+        validator = ToolValidator("missing-tool", subprocess_factory=mock_subprocess)
+
+        result = await validator.validate()
+
+        assert result["status"] == "failed"
+        assert result["tool"] == "missing-tool"
+        assert "not found" in result["message"]
+        mock_subprocess.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "version_command",
+        [
+            "java -version 2>&1",
+            "tool --version | head -1",
+            "$TOOL_HOME/bin/tool -v",
+            "LC_ALL=C tool --version",
+            "tool --version 'unbalanced",
+        ],
+        ids=["redirect", "pipe", "variable", "env_assignment", "unbalanced_quote"],
+    )
+    async def test_tool_validation_runs_shell_commands_through_shell(
+        self, monkeypatch, make_proc, version_command
+    ):
+        """Test that version commands using shell syntax are passed to the shell."""
+        monkeypatch.setattr(shutil, "which", lambda cmd: None)
+        mock_subprocess = AsyncMock(return_value=make_proc(0, b"tool 1.0\n"))
+        validator = ToolValidator(
+            "tool", version_command, subprocess_factory=mock_subprocess
+        )
+
+        result = await validator.validate()
+
+        assert result["status"] == "passed"
+        assert mock_subprocess.call_args.args == (version_command,)
+
+    async def test_tool_validation_reuses_cached_probe(self, make_proc):
+        """Test that repeat validations of the same tool do not spawn again."""
+        mock_subprocess = AsyncMock(return_value=make_proc(0, b"version 1.0\n"))
+
+        first = await ToolValidator(
+            "cached-tool", subprocess_factory=mock_subprocess
+        ).validate()
+        second = await ToolValidator(
+            "cached-tool", subprocess_factory=mock_subprocess
+        ).validate()
+
+        assert first == second
+        assert first["status"] == "passed"
+        mock_subprocess.assert_called_once()
+
+    async def test_tool_validation_shares_one_probe_between_concurrent_checks(
+        self, make_proc
+    ):
+        """Test that concurrent validations of the same tool spawn only once."""
+        mock_subprocess = AsyncMock(return_value=make_proc(0, b"version 1.0\n"))
+        validators = [
+            ToolValidator("racing-tool", subprocess_factory=mock_subprocess)
+            for _ in range(3)
+        ]
+
+        results = await asyncio.gather(*(v.validate() for v in validators))
+
+        assert all(result["status"] == "passed" for result in results)
+        mock_subprocess.assert_called_once()
+
+    async def test_tool_validation_does_not_cache_failed_probe(self, make_proc):
+        """Test that a failed probe is retried on the next validation."""
+        mock_subprocess = AsyncMock(
+            side_effect=[make_proc(1, b"", b"broken"), make_proc(0, b"version 1.0\n")]
+        )
+
+        first = await ToolValidator(
+            "flaky-tool", subprocess_factory=mock_subprocess
+        ).validate()
+        second = await ToolValidator(
+            "flaky-tool", subprocess_factory=mock_subprocess
+        ).validate()
+
+        assert first["status"] == "failed"
+        assert second["status"] == "passed"
+        assert mock_subprocess.call_count == 2
+
+    async def test_tool_validation_handles_timeout_gracefully(self, make_proc):
         """Test that tool validation handles command timeouts gracefully."""
-        validator = ToolValidator("slow-tool")
+        mock_process = make_proc(0)
+        mock_process.communicate.side_effect = asyncio.TimeoutError()
+        validator = ToolValidator(
+            "slow-tool", subprocess_factory=AsyncMock(return_value=mock_process)
+        )
 
-        with patch("asyncio.create_subprocess_shell"):
-            with patch("asyncio.wait_for", side_effect=asyncio.TimeoutError()):
-                result = await validator.validate()
+        result = await validator.validate()
 
-            assert result["status"] == "failed"
-            assert result["tool"] == "slow-tool"
-            assert "timed out" in result["message"]
+        assert result["status"] == "failed"
+        assert result["tool"] == "slow-tool"
+        assert "timed out" in result["message"]
+        mock_process.kill.assert_called_once_with()
+        mock_process.wait.assert_awaited_once_with()
 
-    @pytest.mark.asyncio
     async def test_tool_validation_handles_subprocess_errors(self):
         """Test that tool validation handles subprocess creation errors."""
-        validator = ToolValidator("error-tool")
+        validator = ToolValidator(
+            "error-tool",
+            subprocess_factory=AsyncMock(side_effect=Exception("Process error")),
+        )
 
-        with patch(
-            "asyncio.create_subprocess_shell", side_effect=Exception("Process error")
-        ):
-            result = await validator.validate()
+        result = await validator.validate()
 
-            assert result["status"] == "failed"
-            assert result["tool"] == "error-tool"
-            assert "Process error" in result["message"]
+        assert result["status"] == "failed"
+        assert result["tool"] == "error-tool"
+        assert "Process error" in result["message"]
 
 
 class TestKubernetesValidator:
     """Test KubernetesValidator behavior for checking Kubernetes connectivity."""
 
+    # Shared kubectl outcomes for fake_kubectl
+    OK = (0, b"ok", b"")
+    DENIED = (1, b"no", b"")
+
     def test_kubernetes_validator_initializes_with_namespace(self):
         """Test that KubernetesValidator properly initializes with required namespace."""
         validator = KubernetesValidator("test-ns")
@@ -148,132 +270,100 @@ class TestKubernetesValidator:
         assert validator.namespace == "test-ns"
         assert validator.context == "test-context"
 
-    @pytest.mark.asyncio
-    async def test_kubernetes_validation_passes_with_full_access(self):
+    async def test_kubernetes_validation_passes_with_full_access(self, fake_kubectl):
         """Test that Kubernetes validation passes when all checks succeed."""
-        validator = KubernetesValidator("test-ns", "test-context")
-
-        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
-            # Mock all three checks to succeed
-            mock_process = AsyncMock()
-            mock_process.returncode = 0
-            mock_subprocess.return_value = mock_process
+        mock_subprocess = fake_kubectl({"--raw": self.OK, "can-i": self.OK})
+        validator = KubernetesValidator(
+            "test-ns", "test-context", subprocess_factory=mock_subprocess
+        )
 
-            with patch("asyncio.wait_for", return_value=(b"success", b"")):
-                result = await validator.validate()
-
-            assert result["status"] == "passed"
-            assert len(result["checks"]) == 3
-            assert all(check["passed"] for check in result["checks"])
+        result = await validator.validate()
 
-    @pytest.mark.asyncio
-    async def test_kubernetes_validation_fails_on_cluster_connectivity_issues(self):
+        assert result["status"] == "passed"
+        assert len(result["checks"]) == 3
+        assert all(check["passed"] for check in result["checks"])
+        assert {call.args[:3] for call in mock_subprocess.call_args_list} == {
+            ("kubectl", "--context", "test-context")
+        }
+
+    async def test_kubernetes_validation_fails_on_cluster_connectivity_issues(
+        self, fake_kubectl
+    ):
         """Test that Kubernetes validation fails when cluster is unreachable."""
-        validator = KubernetesValidator("test-ns")
-
-        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
-            mock_process = AsyncMock()
-            mock_process.returncode = 1
-            mock_subprocess.return_value = mock_process
+        refused = (1, b"", b"connection refused")
+        validator = KubernetesValidator(
+            "test-ns",
+            subprocess_factory=fake_kubectl({"--raw": refused, "can-i": refused}),
+        )
 
-            with patch("asyncio.wait_for", return_value=(b"", b"connection refused")):
-                result = await validator.validate()
+        result = await validator.validate()
 
-            assert result["status"] == "failed"
-            assert len(result["checks"]) == 1
-            assert not result["checks"][0]["passed"]
-            assert "Cannot connect to cluster" in result["checks"][0]["message"]
+        assert result["status"] == "failed"
+        assert len(result["checks"]) == 1
+        assert not result["checks"][0]["passed"]
+        assert "Cannot connect to cluster" in result["checks"][0]["message"]
 
-    @pytest.mark.asyncio
     async def test_kubernetes_validation_handles_cluster_connection_exceptions(self):
         """Test that Kubernetes validation handles cluster connection exceptions."""
-        validator = KubernetesValidator("test-ns")
+        validator = KubernetesValidator(
+            "test-ns",
+            subprocess_factory=AsyncMock(side_effect=Exception("Network error")),
+        )
 
-        with patch(
-            "asyncio.create_subprocess_exec", side_effect=Exception("Network error")
-        ):
-            result = await validator.validate()
+        result = await validator.validate()
 
-            assert result["status"] == "failed"
-            assert len(result["checks"]) == 1
-            assert not result["checks"][0]["passed"]
-            assert "Network error" in result["checks"][0]["message"]
+        assert result["status"] == "failed"
+        assert len(result["checks"]) == 1
+        assert not result["checks"][0]["passed"]
+        assert "Network error" in result["checks"][0]["message"]
 
-    @pytest.mark.asyncio
-    async def test_kubernetes_validation_continues_on_namespace_access_issues(self):
+    async def test_kubernetes_validation_continues_on_namespace_access_issues(
+        self, fake_kubectl
+    ):
         """Test that Kubernetes validation continues when namespace access fails."""
-        validator = KubernetesValidator("test-ns")
-
-        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
-            # First call (cluster-info) succeeds, second (namespace) fails, third (permissions) succeeds
-            success_process = AsyncMock()
-            success_process.returncode = 0
-            
-            fail_process = AsyncMock()
-            fail_process.returncode = 1
+        not_found = (1, b"", b'Error from server (NotFound): "test-ns" not found')
+        validator = KubernetesValidator(
+            "test-ns",
+            subprocess_factory=fake_kubectl({"--raw": not_found, "can-i": self.OK}),
+        )
 
-            mock_subprocess.side_effect = [success_process, fail_process, success_process]
-
-            with patch("asyncio.wait_for", side_effect=[
-                (b"cluster ok", b""),
-                (b"", b"namespace not found"),
-            ]):
-                result = await validator.validate()
+        result = await validator.validate()
 
-            # Should be warning (not failed) since namespace is non-critical
-            assert result["status"] == "warning"
-            assert len(result["checks"]) == 3
+        # Should be warning (not failed) since namespace is non-critical
+        assert result["status"] == "warning"
+        assert len(result["checks"]) == 3
 
-    @pytest.mark.asyncio
-    async def test_kubernetes_validation_gracefully_handles_permission_check_failures(self):
+    async def test_kubernetes_validation_gracefully_handles_permission_check_failures(
+        self, fake_kubectl
+    ):
         """Test that permission check failures are handled gracefully."""
-        validator = KubernetesValidator("test-ns")
-
-        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
-            # First two succeed, third fails
-            success_process = AsyncMock()
-            success_process.returncode = 0
-            
-            fail_process = AsyncMock()
-            fail_process.returncode = 1
-
-            mock_subprocess.side_effect = [success_process, success_process, fail_process]
+        validator = KubernetesValidator(
+            "test-ns",
+            subprocess_factory=fake_kubectl({"--raw": self.OK, "can-i": self.DENIED}),
+        )
 
-            with patch("asyncio.wait_for", side_effect=[
-                (b"ok", b""),
-                (b"ok", b""),
-            ]):
-                result = await validator.validate()
+        result = await validator.validate()
 
-            assert result["status"] == "warning"
-            assert len(result["checks"]) == 3
-            assert not result["checks"][2]["passed"]  # permissions check failed
+        assert result["status"] == "warning"
+        assert len(result["checks"]) == 3
+        assert not result["checks"][2]["passed"]  # permissions check failed
 
-    @pytest.mark.asyncio
-    async def test_kubernetes_validation_skips_permission_check_on_exception(self):
+    async def test_kubernetes_validation_skips_permission_check_on_exception(
+        self, fake_kubectl
+    ):
         """Test that permission check exceptions are handled non-critically."""
-        validator = KubernetesValidator("test-ns")
-
-        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
-            success_process = AsyncMock()
-            success_process.returncode = 0
-
-            def side_effect(*args, **kwargs):
-                if "auth" in args and "can-i" in args:
-                    raise Exception("Auth error")
-                return success_process
+        validator = KubernetesValidator(
+            "test-ns",
+            subprocess_factory=fake_kubectl(
+                {"--raw": self.OK, "can-i": Exception("Auth error")}
+            ),
+        )
 
-            mock_subprocess.side_effect = side_effect
-
-            with patch("asyncio.wait_for", side_effect=[
-                (b"ok", b""),
-                (b"ok", b""),
-            ]):
-                result = await validator.validate()
+        result = await validator.validate()
 
-            # Should still pass because permissions check is non-critical
-            assert result["status"] == "passed"
-            assert len(result["checks"]) == 2  # Only cluster and namespace checks
+        # Should still pass because permissions check is non-critical
+        assert result["status"] == "passed"
+        assert len(result["checks"]) == 2  # Only cluster and namespace checks
 
 
 class TestFileSystemValidator:
@@ -290,11 +380,10 @@ class TestFileSystemValidator:
         validator = FileSystemValidator(paths)
         assert validator.required_paths == paths
 
-    @pytest.mark.asyncio
-    async def test_filesystem_validation_passes_with_existing_paths(self):
+    async def test_filesystem_validation_passes_with_existing_paths(self, monkeypatch):
         """Test that filesystem validation passes when all paths exist."""
-        # Use paths that should exist on most systems
         validator = FileSystemValidator(["/tmp", "/usr"])
+        monkeypatch.setattr(os, "stat", _fake_stat({"/tmp": _DIR, "/usr": _DIR}))
 
         result = await validator.validate()
 
@@ -302,10 +391,10 @@ class TestFileSystemValidator:
         assert len(result["paths"]) == 2
         assert all(path_info["exists"] for path_info in result["paths"])
 
-    @pytest.mark.asyncio
-    async def test_filesystem_validation_warns_on_missing_paths(self):
+    async def test_filesystem_validation_warns_on_missing_paths(self, monkeypatch):
         """Test that filesystem validation warns when some paths don't exist."""
         validator = FileSystemValidator(["/tmp", "/nonexistent/path/that/should/not/exist"])
+        monkeypatch.setattr(os, "stat", _fake_stat({"/tmp": _DIR}))
 
         result = await validator.validate()
 
@@ -321,23 +410,46 @@ class TestFileSystemValidator:
         assert missing["exists"] is False
         assert "does not exist" in missing["message"]
 
-    @pytest.mark.asyncio
-    async def test_filesystem_validation_distinguishes_files_from_directories(self):
+    async def test_filesystem_validation_distinguishes_files_from_directories(
+        self, monkeypatch
+    ):
         """Test that filesystem validation correctly identifies files vs directories."""
-        with tempfile.NamedTemporaryFile() as tmp_file:
-            validator = FileSystemValidator([tmp_file.name, "/tmp"])
+        validator = FileSystemValidator(["/fake/file", "/tmp"])
+        monkeypatch.setattr(os, "stat", _fake_stat({"/fake/file": _FILE, "/tmp": _DIR}))
 
-            result = await validator.validate()
+        result = await validator.validate()
 
-            assert result["status"] == "passed"
+        assert result["status"] == "passed"
 
-            file_info = next(p for p in result["paths"] if p["path"] == tmp_file.name)
-            dir_info = next(p for p in result["paths"] if p["path"] == "/tmp")
+        file_info = next(p for p in result["paths"] if p["path"] == "/fake/file")
+        dir_info = next(p for p in result["paths"] if p["path"] == "/tmp")
 
-            assert file_info["type"] == "file"
-            assert dir_info["type"] == "directory"
+        assert file_info["type"] == "file"
+        assert dir_info["type"] == "directory"
+
+    @pytest.mark.parametrize(
+        "name", ["loop", "bad\0name"], ids=["symlink_loop", "embedded_nul"]
+    )
+    async def test_filesystem_validation_reports_unstattable_paths_as_missing(
+        self, tmp_path, name
+    ):
+        """Test that paths os.stat cannot resolve are reported as missing."""
+        loop = tmp_path / "loop"
+        loop.symlink_to(loop)
+        path_str = str(tmp_path / name)
+        validator = FileSystemValidator([path_str])
+
+        result = await validator.validate()
+
+        assert result["status"] == "warning"
+        assert result["paths"] == [
+            {
+                "path": path_str,
+                "exists": False,
+                "message": f"Path {path_str} does not exist",
+            }
+        ]
 
-    @pytest.mark.asyncio
     async def test_filesystem_validation_passes_with_empty_requirements(self):
         """Test that filesystem validation passes when no paths are required."""
         validator = FileSystemValidator()
@@ -362,89 +474,61 @@ class TestNetworkValidator:
         validator = NetworkValidator(endpoints)
         assert validator.endpoints == endpoints
 
-    @pytest.mark.asyncio
-    async def test_network_validation_detects_reachable_endpoints(self):
-        """Test that network validation correctly identifies reachable endpoints."""
-        validator = NetworkValidator(["http://example.com"])
-
-        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
-            mock_process = AsyncMock()
-            mock_process.returncode = 0
-            mock_subprocess.return_value = mock_process
-
-            with patch("asyncio.wait_for", return_value=(b"200", b"")):
-                result = await validator.validate()
-
-            assert result["status"] == "passed"
-            assert len(result["endpoints"]) == 1
-            assert result["endpoints"][0]["reachable"] is True
-            assert result["endpoints"][0]["status_code"] == "200"
-
-    @pytest.mark.asyncio
-    async def test_network_validation_detects_unreachable_endpoints(self):
-        """Test that network validation correctly identifies unreachable endpoints."""
-        validator = NetworkValidator(["http://unreachable.invalid"])
-
-        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
-            mock_process = AsyncMock()
-            mock_process.returncode = 1
-            mock_subprocess.return_value = mock_process
-
-            with patch("asyncio.wait_for", return_value=(b"", b"connection failed")):
-                result = await validator.validate()
-
-            assert result["status"] == "warning"
-            assert len(result["endpoints"]) == 1
-            assert result["endpoints"][0]["reachable"] is False
-            assert "not reachable" in result["endpoints"][0]["message"]
-
-    @pytest.mark.asyncio
-    async def test_network_validation_handles_connection_exceptions(self):
-        """Test that network validation handles connection exceptions gracefully."""
-        validator = NetworkValidator(["http://error.test"])
-
-        with patch(
-            "asyncio.create_subprocess_exec", side_effect=Exception("Network error")
-        ):
+    @pytest.mark.parametrize(
+        "responses,status,expected",
+        [
+            (
+                {"http://example.com": 200},
+                "passed",
+                [{"reachable": True, "status_code": "200"}],
+            ),
+            (
+                {
+                    "http://unreachable.invalid": aiohttp.ClientConnectionError(
+                        "connection failed"
+                    )
+                },
+                "warning",
+                [{"reachable": False, "message": "Endpoint not reachable"}],
+            ),
+            (
+                {"http://error.test": Exception("Network error")},
+                "warning",
+                [{"reachable": False, "message": "Network error"}],
+            ),
+            (
+                {"http://good.test": 200, "http://bad.test": asyncio.TimeoutError()},
+                "warning",
+                [
+                    {"reachable": True, "status_code": "200"},
+                    {"reachable": False, "message": "Endpoint not reachable"},
+                ],
+            ),
+            ({}, "passed", []),
+        ],
+        ids=["reachable", "unreachable", "unexpected_error", "mixed", "no_endpoints"],
+    )
+    async def test_network_validation_reports_endpoint_outcomes(
+        self, responses, status, expected
+    ):
+        """Test that network validation reports each endpoint and the overall status.
+
+        A response is an HTTP status code, or an exception raised by the request.
+        """
+        validator = NetworkValidator(list(responses))
+
+        with aioresponses() as m:
+            for url, response in responses.items():
+                if isinstance(response, Exception):
+                    m.head(url, exception=response)
+                else:
+                    m.head(url, status=response)
             result = await validator.validate()
 
-            assert result["status"] == "warning"
-            assert len(result["endpoints"]) == 1
-            assert result["endpoints"][0]["reachable"] is False
-            assert "Network error" in result["endpoints"][0]["message"]
-
-    @pytest.mark.asyncio
-    async def test_network_validation_aggregates_mixed_results(self):
-        """Test that network validation properly aggregates mixed endpoint results."""
-        validator = NetworkValidator(["http://good.test", "http://bad.test"])
-
-        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
-            good_process = AsyncMock()
-            good_process.returncode = 0
-            
-            bad_process = AsyncMock()
-            bad_process.returncode = 1
-
-            mock_subprocess.side_effect = [good_process, bad_process]
-
-            with patch("asyncio.wait_for", side_effect=[
-                (b"200", b""),
-                (b"", b"error"),
-            ]):
-                result = await validator.validate()
-
-            assert result["status"] == "warning"  # Due to one failure
-            assert len(result["endpoints"]) == 2
-
-    @pytest.mark.asyncio
-    async def test_network_validation_passes_with_empty_endpoints(self):
-        """Test that network validation passes when no endpoints are configured."""
-        validator = NetworkValidator()
-
-        result = await validator.validate()
-
-        assert result["status"] == "passed"
-        assert result["endpoints"] == []
+        assert result["status"] == status
+        assert result["endpoints"] == [
+            {"endpoint": url, **fields} for url, fields in zip(responses, expected)
+        ]
 
 
 class TestPrerequisiteValidator:
@@ -458,18 +542,18 @@ class TestPrerequisiteValidator:
     def test_prerequisite_validator_accepts_custom_validators(self):
         """Test that PrerequisiteValidator accepts custom validator implementations."""
         main_validator = PrerequisiteValidator()
-        custom_validator = MockValidator({"status": "passed"})
+        custom_validator = _PASS
 
         main_validator.add_validator(custom_validator)
 
         assert len(main_validator.validators) == 1
         assert main_validator.validators[0] == custom_validator
 
-    @pytest.mark.asyncio
-    async def test_prerequisite_validation_passes_with_no_requirements(self):
+    async def test_prerequisite_validation_passes_with_no_requirements(
+        self, environment
+    ):
         """Test that prerequisite validation passes when no tools or validators are required."""
         validator = PrerequisiteValidator()
-        environment = EnvironmentConfig(name="test", namespace="test-ns")
 
         result = await validator.validate(environment)
 
@@ -478,91 +562,79 @@ class TestPrerequisiteValidator:
         assert result["results"] == []
         assert "successfully" in result["summary"]
 
-    @pytest.mark.asyncio
-    async def test_prerequisite_validation_creates_tool_validators_for_required_tools(self):
+    async def test_prerequisite_validation_creates_tool_validators_for_required_tools(
+        self, environment
+    ):
         """Test that prerequisite validation automatically creates validators for required tools."""
-        validator = PrerequisiteValidator()
-        environment = EnvironmentConfig(name="test", namespace="test-ns")
+        validator = PrerequisiteValidator(tool_validator_factory=_tool_stub("passed"))
 
-        with patch.object(
-            ToolValidator, "validate", return_value={"status": "passed", "tool": "echo"}
-        ):
-            result = await validator.validate(environment, required_tools=["echo"])
+        result = await validator.validate(environment, required_tools=["echo"])
 
         assert result["all_passed"] is True
-        assert len(result["results"]) == 1
+        assert result["results"] == [{"status": "passed", "tool": "echo"}]
 
-    @pytest.mark.asyncio
-    async def test_prerequisite_validation_includes_kubernetes_validator_for_kubectl(self):
+    async def test_prerequisite_validation_includes_kubernetes_validator_for_kubectl(
+        self, environment
+    ):
         """Test that prerequisite validation includes Kubernetes validation when kubectl is required."""
-        validator = PrerequisiteValidator()
-        environment = EnvironmentConfig(name="test", namespace="test-ns")
+        validator = PrerequisiteValidator(
+            tool_validator_factory=_tool_stub("passed"),
+            kubernetes_validator_factory=lambda **kwargs: MockValidator(
+                {"status": "passed", "checks": []}
+            ),
+        )
 
-        with patch.object(
-            ToolValidator, "validate", return_value={"status": "passed", "tool": "kubectl"}
-        ), patch.object(
-            KubernetesValidator, "validate", return_value={"status": "passed", "checks": []}
-        ):
-            result = await validator.validate(environment, required_tools=["kubectl"])
+        result = await validator.validate(environment, required_tools=["kubectl"])
 
         assert result["all_passed"] is True
         assert len(result["results"]) == 2  # Tool + Kubernetes validator
 
-    @pytest.mark.asyncio
-    async def test_prerequisite_validation_aggregates_failures_correctly(self):
+    async def test_prerequisite_validation_aggregates_failures_correctly(
+        self, environment
+    ):
         """Test that prerequisite validation correctly identifies and reports failures."""
-        validator = PrerequisiteValidator()
-        environment = EnvironmentConfig(name="test", namespace="test-ns")
+        validator = PrerequisiteValidator(tool_validator_factory=_tool_stub("failed"))
 
-        with patch.object(
-            ToolValidator, "validate", return_value={"status": "failed", "tool": "missing"}
-        ):
-            result = await validator.validate(environment, required_tools=["missing"])
+        result = await validator.validate(environment, required_tools=["missing"])
 
         assert result["all_passed"] is False
         assert result["has_warnings"] is False
         assert "failed" in result["summary"]
 
-    @pytest.mark.asyncio
-    async def test_prerequisite_validation_distinguishes_warnings_from_failures(self):
+    async def test_prerequisite_validation_distinguishes_warnings_from_failures(
+        self, environment
+    ):
         """Test that prerequisite validation properly handles warnings vs failures."""
-        validator = PrerequisiteValidator()
-        environment = EnvironmentConfig(name="test", namespace="test-ns")
+        validator = PrerequisiteValidator(tool_validator_factory=_tool_stub("warning"))
 
-        with patch.object(
-            ToolValidator, "validate", return_value={"status": "warning", "tool": "partial"}
-        ):
-            result = await validator.validate(environment, required_tools=["partial"])
+        result = await validator.validate(environment, required_tools=["partial"])
 
         assert result["all_passed"] is True  # Warnings don't fail validation
         assert result["has_warnings"] is True
         assert "warnings" in result["summary"]
 
-    @pytest.mark.asyncio
-    async def test_prerequisite_validation_executes_custom_validators(self):
+    async def test_prerequisite_validation_executes_custom_validators(
+        self, environment
+    ):
         """Test that prerequisite validation executes custom validators alongside built-in ones."""
         main_validator = PrerequisiteValidator()
         custom_validator = MockValidator({"status": "passed", "custom": True})
         main_validator.add_validator(custom_validator)
 
-        environment = EnvironmentConfig(name="test", namespace="test-ns")
-
         result = await main_validator.validate(environment)
 
         assert result["all_passed"] is True
         assert len(result["results"]) == 1
         assert result["results"][0]["custom"] is True
 
-    @pytest.mark.asyncio
-    async def test_prerequisite_validation_handles_mixed_validation_results(self):
+    async def test_prerequisite_validation_handles_mixed_validation_results(
+        self, environment
+    ):
         """Test that prerequisite validation correctly aggregates mixed validation results."""
         validator = PrerequisiteValidator()
-        environment = EnvironmentConfig(name="test", namespace="test-ns")
 
         # Add validators with different results
-        validator.add_validator(MockValidator({"status": "passed"}))
-        validator.add_validator(MockValidator({"status": "warning"}))
-        validator.add_validator(MockValidator({"status": "failed"}))
+        validator.validators.extend([_PASS, _WARN, _FAIL])
 
         result = await validator.validate(environment)
 
@@ -571,6 +643,28 @@ class TestPrerequisiteValidator:
         assert len(result["results"]) == 3
         assert "failed" in result["summary"]
 
+    async def test_prerequisite_validation_reports_crashed_validators_as_failed(
+        self, environment
+    ):
+        """Test that a validator raising an exception counts as a failure."""
+        validator = PrerequisiteValidator()
+
+        crashing = MockValidator(None)
+        crashing.validate = AsyncMock(side_effect=RuntimeError("boom"))
+        validator.add_validator(_PASS)
+        validator.add_validator(crashing)
+
+        result = await validator.validate(environment)
+
+        assert result["all_passed"] is False
+        assert result["results"][0] == {"status": "passed"}
+        assert result["results"][1] == {
+            "status": "failed",
+            "validator": "MockValidator",
+            "message": "MockValidator raised RuntimeError: boom",
+        }
+        assert "1 prerequisites failed" in result["summary"]
+
     def test_prerequisite_validation_generates_accurate_summaries(self):
         """Test that prerequisite validation generates accurate summary messages."""
         validator = PrerequisiteValidator()
@@ -588,4 +682,22 @@ class TestPrerequisiteValidator:
         # Test warnings only
         warnings_only = [{"status": "passed"}, {"status": "warning"}]
         summary = validator._generate_summary(warnings_only)
-        assert "1 warnings" in summary
\ No newline at end of file
+        assert "1 warnings" in summary
+
+
+class TestMaxProcesses:
+    """Test parsing of the PHAZR_MAX_PROCS subprocess cap."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [(None, 16), ("4", 4), ("0", 1), ("-3", 1), ("many", 16), ("", 16)],
+        ids=["unset", "valid", "zero", "negative", "not_a_number", "empty"],
+    )
+    def test_max_processes_falls_back_and_clamps(self, monkeypatch, value, expected):
+        """Test that bad PHAZR_MAX_PROCS values fall back or clamp to at least one."""
+        if value is None:
+            monkeypatch.delenv("PHAZR_MAX_PROCS", raising=False)
+        else:
+            monkeypatch.setenv("PHAZR_MAX_PROCS", value)
+
+        assert _max_processes_from_env() == expected
@@ -4,54 +4,128 @@ Test utility functions and helpers.
 
 import asyncio
 import json
+import sys
 from pathlib import Path
-from typing import Any, Dict, List
-from unittest.mock import AsyncMock
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock, Mock
+
+import yaml
 
 from phazr.models import ExecutionResult, Operation, OperationType
 
+# Prefer libyaml's C emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+
+class _Ready:
+    """Awaitable that resolves to a fixed value without suspending.
+
+    Cheaper than a coroutine for mocks that only hand back canned data, and
+    usable without a running event loop, unlike a completed Future.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __await__(self):
+        return self.value
+        yield  # Unreachable; makes __await__ a generator
+
 
 class MockProcess:
-    """Mock subprocess for testing."""
+    """Mock subprocess for testing.
+
+    kill (a Mock, as Process.kill is synchronous) and wait (an AsyncMock) are
+    built on first access, since most tests never touch them. Reading either
+    before any call returns that same mock, so assertions made later see every
+    call; either can also be replaced by assignment.
+    """
+
+    __slots__ = (
+        "_kill",
+        "_output",
+        "_wait",
+        "_wait_called",
+        "returncode",
+        "stderr",
+        "stdout",
+    )
 
     def __init__(self, returncode: int = 0, stdout: bytes = b"", stderr: bytes = b""):
         self.returncode = returncode
         self.stdout = MockStream(stdout)
         self.stderr = MockStream(stderr)
         self._wait_called = False
-        self.kill = AsyncMock()
-        self.wait = AsyncMock(return_value=returncode)
-
-    async def communicate(self, input=None):
+        self._kill = None
+        self._wait = None
+        self._output = _Ready((stdout, stderr))
+
+    @property
+    def kill(self):
+        """Mock kill method."""
+        if self._kill is None:
+            self._kill = Mock()
+        return self._kill
+
+    @kill.setter
+    def kill(self, value):
+        self._kill = value
+
+    @property
+    def wait(self):
+        """Mock wait method, resolving to the return code."""
+        if self._wait is None:
+            self._wait = AsyncMock(return_value=self.returncode)
+        return self._wait
+
+    @wait.setter
+    def wait(self, value):
+        self._wait = value
+
+    def communicate(self, input=None):
         """Mock communicate method."""
-        return await self.stdout.read(), await self.stderr.read()
+        self.stdout._read_called = True
+        self.stderr._read_called = True
+        return self._output
 
 
 class MockStream:
     """Mock stream for process stdout/stderr."""
 
+    __slots__ = ("_read_called", "_ready", "data")
+
     def __init__(self, data: bytes):
         self.data = data
         self._read_called = False
+        self._ready = _Ready(data)
 
-    async def read(self):
+    def read(self):
         """Mock read method."""
         self._read_called = True
-        return self.data
+        return self._ready
+
+
+# Result helpers use model_construct: their inputs are trusted, so pydantic
+# validation is skipped. Each call still builds a fresh model, because the
+# orchestrator mutates results (it sets duration after execution).
 
 
 def create_successful_result(
     operation: Operation, output: str = "Success"
 ) -> ExecutionResult:
     """Create a successful execution result."""
-    return ExecutionResult(
+    return ExecutionResult.model_construct(
         operation=operation,
         success=True,
         output=output,
-        error_message=None,
-        start_time=0.0,
-        end_time=1.0,
-        return_code=0,
+        error=None,
+        duration=1.0,
+        metadata={"return_code": 0},
     )
 
 
@@ -59,55 +133,77 @@ def create_failed_result(
     operation: Operation, error_message: str = "Test error", return_code: int = 1
 ) -> ExecutionResult:
     """Create a failed execution result."""
-    return ExecutionResult(
+    return ExecutionResult.model_construct(
         operation=operation,
         success=False,
         output="",
-        error_message=error_message,
-        start_time=0.0,
-        end_time=1.0,
-        return_code=return_code,
+        error=error_message,
+        duration=1.0,
+        metadata={"return_code": return_code},
     )
 
 
 async def wait_for_condition(condition, timeout: float = 1.0, interval: float = 0.01):
-    """Wait for a condition to become true."""
+    """Wait for a condition to become true.
+
+    Polling starts at ``interval`` and doubles up to a tenth of a second, or
+    stays at ``interval`` if that is already longer.
+    """
     elapsed = 0.0
+    delay = interval
+    max_delay = max(interval, 0.1)
     while elapsed < timeout:
         if condition():
             return True
-        await asyncio.sleep(interval)
-        elapsed += interval
+        step = min(delay, timeout - elapsed)
+        await asyncio.sleep(step)
+        elapsed += step
+        delay = min(delay * 2, max_delay)
     return False
 
 
 def create_test_config_file(config_dir: Path, content: Dict[str, Any]) -> Path:
     """Create a test configuration file."""
-    import yaml
-
     config_file = config_dir / "test.yaml"
-    with open(config_file, "w") as f:
-        yaml.dump(content, f)
+    config_file.write_text(yaml.dump(content, Dumper=_Dumper, default_flow_style=False))
     return config_file
 
 
-def assert_operation_executed(mock_handler, operation: Operation):
-    """Assert that an operation was executed through a mock handler."""
+def assert_operation_executed(
+    mock_handler, operation: Operation, *, by_identity: bool = True
+):
+    """Assert that an operation was executed through a mock handler.
+
+    The same object passes on an identity check, skipping the field-by-field
+    model comparison; anything else falls back to equality.
+    """
     mock_handler.execute.assert_called()
-    call_args = mock_handler.execute.call_args
-    assert call_args[0][0] == operation
+    executed = mock_handler.execute.call_args[0][0]
+    if by_identity and executed is operation:
+        return
+    assert executed == operation
+
+
+def assert_operations_executed(mock_handler, operations: List[Operation]):
+    """Assert that a mock handler executed exactly these operations, in order."""
+    executed = [call[0][0] for call in mock_handler.execute.call_args_list]
+    assert len(executed) == len(operations)
+    for got, expected in zip(executed, operations):
+        assert got is expected or got == expected
 
 
 def create_kubectl_operation(
     command: str = "get pods", service: str = "test-service", namespace: str = "default"
 ) -> Operation:
     """Create a kubectl operation for testing."""
-    return Operation(
+    # Trusted test input, so skip pydantic validation
+    return Operation.model_construct(
         command=command,
         description=f"Kubectl: {command}",
         type=OperationType.KUBECTL_EXEC,
-        service=service,
-        namespace=namespace,
+        # Fixtures repeat a handful of names, so share one copy of each
+        service=sys.intern(service),
+        namespace=sys.intern(namespace),
         timeout=300,
     )
 
@@ -116,7 +212,8 @@ def create_http_operation(
     url: str = "http://example.com/api", method: str = "GET"
 ) -> Operation:
     """Create an HTTP operation for testing."""
-    return Operation(
+    # Trusted test input, so skip pydantic validation
+    return Operation.model_construct(
         command=json.dumps({"url": url, "method": method}),
         description=f"HTTP {method} {url}",
         type=OperationType.HTTP_REQUEST,
@@ -142,44 +239,58 @@ class AsyncIterator:
         return item
 
 
+def _mock_subprocess_factory(
+    return_value: Optional[MockProcess], side_effect: Optional[Exception]
+) -> Mock:
+    """Build a create_subprocess_* mock.
+
+    A plain Mock returning a ready awaitable records calls like any mock without
+    AsyncMock's per-call coroutine. With side_effect set the call itself raises,
+    which an ``await create(...)`` caller sees the same way.
+    """
+    if side_effect:
+        return Mock(side_effect=side_effect)
+    return Mock(return_value=_Ready(return_value or MockProcess()))
+
+
 def mock_async_subprocess_exec(
     return_value: MockProcess = None, side_effect: Exception = None
 ):
     """Create a mock for asyncio.create_subprocess_exec."""
-    if return_value is None:
-        return_value = MockProcess()
-
-    mock = AsyncMock()
-    if side_effect:
-        mock.side_effect = side_effect
-    else:
-        mock.return_value = return_value
-
-    return mock
+    return _mock_subprocess_factory(return_value, side_effect)
 
 
 def mock_async_subprocess_shell(
     return_value: MockProcess = None, side_effect: Exception = None
 ):
     """Create a mock for asyncio.create_subprocess_shell."""
-    if return_value is None:
-        return_value = MockProcess()
+    return _mock_subprocess_factory(return_value, side_effect)
 
-    mock = AsyncMock()
-    if side_effect:
-        mock.side_effect = side_effect
-    else:
-        mock.return_value = return_value
 
-    return mock
+class TestTimer:
+    """Helper for testing time-based operations.
+
+    Time is counted in whole microseconds, so long runs of small steps do not
+    pick up float rounding error.
+    """
 
+    # Not a test class, despite the name
+    __test__ = False
 
-class TestTimer:
-    """Helper for testing time-based operations."""
+    _US_PER_S = 1_000_000
 
     def __init__(self):
         self.start_time = 0.0
-        self.current_time = 0.0
+        self._us = 0
+
+    @property
+    def current_time(self) -> float:
+        """Current mock time in seconds."""
+        return self._us / self._US_PER_S
+
+    @current_time.setter
+    def current_time(self, seconds: float):
+        self._us = round(seconds * self._US_PER_S)
 
     def time(self) -> float:
         """Mock time function."""
@@ -187,9 +298,9 @@ class TestTimer:
 
     def advance(self, seconds: float):
         """Advance the mock time."""
-        self.current_time += seconds
+        self._us += round(seconds * self._US_PER_S)
 
     def reset(self):
         """Reset the timer."""
-        self.current_time = 0.0
+        self._us = 0
         self.start_time = 0.0